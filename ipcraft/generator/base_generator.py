@@ -13,15 +13,51 @@ Future planned implementations:
 - ChiselGenerator: For Chisel HDL generation
 """
 
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Union
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemLoader
+from jinja2.bccache import Bucket
 
 # Support both legacy IPCore and new IpCore models
 from ipcraft.model.core import IpCore
 
 
+class _MemoryBytecodeCache(BytecodeCache):
+    """Size-bounded in-memory store of compiled template bytecode.
+
+    Shared by all generators in the process so each template is compiled
+    once, while every generator keeps its own ``Environment``. Entries are
+    validated against the template source checksum by Jinja on load.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self._capacity = capacity
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        with self._lock:
+            code = self._entries.get(bucket.key)
+            if code is None:
+                return
+            self._entries.move_to_end(bucket.key)
+        bucket.bytecode_from_string(code)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        code = bucket.bytecode_to_string()
+        with self._lock:
+            self._entries[bucket.key] = code
+            self._entries.move_to_end(bucket.key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+
+_SHARED_BYTECODE_CACHE = _MemoryBytecodeCache()
+
+
 class BaseGenerator(ABC):
     """
     Abstract base class for HDL code generators.
@@ -30,7 +66,11 @@ class BaseGenerator(ABC):
     Templates are loaded from a 'templates' subdirectory.
     """
 
-    def __init__(self, template_dir: Union[str, List[str], None] = None):
+    def __init__(
+        self,
+        template_dir: Union[str, List[str], None] = None,
+        bytecode_cache: Optional[BytecodeCache] = None,
+    ):
         """
         Initialize the generator with Jinja2 environment.
 
@@ -38,6 +78,8 @@ class BaseGenerator(ABC):
             template_dir: Optional custom template directory or list of directories.
                           Defaults to 'templates' subdirectory of concrete generator.
                           If a list is provided, templates are searched in order.
+            bytecode_cache: Optional Jinja2 bytecode cache. Defaults to a
+                          bounded in-memory cache shared by all generators.
         """
         if template_dir is None:
             # Default: templates directory relative to concrete class file
@@ -52,6 +94,7 @@ class BaseGenerator(ABC):
             loader=FileSystemLoader(self.template_dirs),
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache or _SHARED_BYTECODE_CACHE,
         )
 
     @abstractmethod
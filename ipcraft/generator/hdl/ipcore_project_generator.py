@@ -10,10 +10,13 @@ Orchestrates the generation of all files needed for an IP core project:
 """
 
 import json
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import warnings
 
+from jinja2 import BytecodeCache
+
 from ipcraft.model.memory_map import AccessType
 
 
@@ -40,8 +43,20 @@ class IpCoreProjectGenerator(
 
     SUPPORTED_BUS_TYPES = ["axil", "avmm"]
 
-    def __init__(self, template_dir: Union[str, List[str], None] = None, bus_library=None):
-        """Initialize VHDL generator with templates."""
+    def __init__(
+        self,
+        template_dir: Union[str, List[str], None] = None,
+        bus_library=None,
+        bytecode_cache: Optional[BytecodeCache] = None,
+        generate_all_cache_size: int = 0,
+    ):
+        """Initialize VHDL generator with templates.
+
+        ``generate_all_cache_size`` keeps that many recent ``generate_all()``
+        results for callers that regenerate an unchanged core repeatedly.
+        Disabled by default, since computing the cache key serializes the
+        whole IP core on every call.
+        """
         default_template_dir = str(Path(__file__).parent / "templates")
         
         search_paths = []
@@ -51,12 +66,17 @@ class IpCoreProjectGenerator(
             search_paths.extend(template_dir)
         search_paths.append(default_template_dir)
 
-        super().__init__(search_paths)
+        super().__init__(search_paths, bytecode_cache=bytecode_cache)
         self._bus_library = bus_library or get_bus_library()
         self.bus_definitions = self._bus_library.get_all_raw_dicts()
         # Relative path from tb/ directory to the .mm.yml file.
         # Set externally before generate_all() when the default '../' is not correct.
         self.mm_yaml_relpath: Optional[str] = None
+        # Most recent generate_all() results keyed by IP core content and options.
+        self._generate_all_cache_size = generate_all_cache_size
+        self._generate_all_cache: "OrderedDict[Tuple[Any, ...], Dict[str, str]]" = (
+            OrderedDict()
+        )
 
     def _get_vhdl_port_type(self, width: int, logical_name: str) -> str:
         """Get VHDL type string for a port based on width.
@@ -556,6 +576,10 @@ class IpCoreProjectGenerator(
         """
         Generate all VHDL files for the IP core.
 
+        When the generator was built with ``generate_all_cache_size``, recent
+        results are cached, keyed by the IP core content and the options;
+        callers always receive a fresh dictionary.
+
         Args:
             ip_core: IP core definition
             bus_type: Bus interface type ('axil' or 'avmm')
@@ -568,6 +592,49 @@ class IpCoreProjectGenerator(
         Returns:
             Dictionary mapping filename to content
         """
+        if self._generate_all_cache_size <= 0:
+            return self._generate_all_uncached(
+                ip_core, bus_type, include_regs, structured, vendor,
+                include_testbench, dump_context, include_docs
+            )
+
+        key = (
+            ip_core.content_hash,
+            bus_type,
+            include_regs,
+            structured,
+            vendor,
+            include_testbench,
+            dump_context,
+            include_docs,
+            self.mm_yaml_relpath,
+        )
+        cache = self._generate_all_cache
+        cached = cache.get(key)
+        if cached is None:
+            cached = self._generate_all_uncached(
+                ip_core, bus_type, include_regs, structured, vendor,
+                include_testbench, dump_context, include_docs
+            )
+            cache[key] = cached
+            if len(cache) > self._generate_all_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return dict(cached)
+
+    def _generate_all_uncached(
+        self,
+        ip_core: IpCore,
+        bus_type: str,
+        include_regs: bool,
+        structured: bool,
+        vendor: str,
+        include_testbench: bool,
+        dump_context: bool,
+        include_docs: bool,
+    ) -> Dict[str, str]:
+        """Render every file requested by ``generate_all``."""
         if structured:
             return self.generate_all_with_structure(
                 ip_core, bus_type, include_regs, vendor, include_testbench,
@@ -7,7 +7,8 @@ from the bus_definitions/ directory.
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, TypedDict
 
 import yaml
 
@@ -105,6 +106,7 @@ class BusLibrary:
     def __init__(self, definitions: Dict[str, BusDefinition]):
         """Initialize with pre-loaded definitions."""
         self._definitions = definitions
+        self._raw_dicts: Optional[Mapping[str, Dict[str, Any]]] = None
 
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "BusLibrary":
@@ -307,9 +309,17 @@ class BusLibrary:
             "ports": [p.to_dict() for p in defn.ports],
         }
 
-    def get_all_raw_dicts(self) -> Dict[str, Dict[str, Any]]:
-        """Get all bus definitions as raw dicts (replaces yaml.safe_load consumers)."""
-        return {key: self.get_raw_bus_dict(key) for key in self._definitions}
+    def get_all_raw_dicts(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all bus definitions as raw dicts (replaces yaml.safe_load consumers).
+
+        The mapping is built on first use and shared by all callers, so it is
+        returned as a read-only view.
+        """
+        if self._raw_dicts is None:
+            self._raw_dicts = MappingProxyType(
+                {key: self.get_raw_bus_dict(key) for key in self._definitions}
+            )
+        return self._raw_dicts
 
 
 # Singleton instance for convenience
@@ -1,5 +1,6 @@
 """Main IP Core model - the canonical representation."""
 
+import hashlib
 from typing import List, Optional, Sequence, TypeVar
 
 from pydantic import Field
@@ -119,6 +120,14 @@ class IpCore(StrictModel):
         """Check if IP core has any bus interfaces."""
         return len(self.bus_interfaces) > 0
 
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the JSON dump, for use as a cache key.
+
+        Recomputed on every access because the model and its lists are mutable.
+        """
+        return hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+
     # --- Reference validation ---
 
     def validate_references(self) -> List[str]:
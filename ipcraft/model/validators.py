@@ -6,7 +6,7 @@ including cross-field and semantic validation.
 """
 
 from dataclasses import dataclass
-from typing import List, Set
+from typing import Dict, List, Set
 
 from .core import IpCore
 from .memory_map import AddressBlock, MemoryMap, RegisterDef
@@ -109,18 +109,21 @@ class IpCoreValidator:
 
     def _validate_address_block(self, mm_name: str, block: AddressBlock) -> None:
         """Validate an address block."""
+        registers = block.registers
+        overlaps = self._overlapping_pairs(registers)
+
         # Check for register overlaps within block
-        for i, reg1 in enumerate(block.registers):
-            for reg2 in block.registers[i + 1 :]:
-                if self._registers_overlap(reg1, reg2):
-                    self.errors.append(
-                        ValidationError(
-                            severity="error",
-                            message=f"Overlapping registers: '{reg1.name}' at {reg1.hex_address} "
-                            f"and '{reg2.name}' at {reg2.hex_address}",
-                            location=f"memory_map:{mm_name}:block:{block.name}",
-                        )
+        for i, reg1 in enumerate(registers):
+            for j in overlaps.get(i, ()):
+                reg2 = registers[j]
+                self.errors.append(
+                    ValidationError(
+                        severity="error",
+                        message=f"Overlapping registers: '{reg1.name}' at {reg1.hex_address} "
+                        f"and '{reg2.name}' at {reg2.hex_address}",
+                        location=f"memory_map:{mm_name}:block:{block.name}",
                     )
+                )
 
             # Check if register is within block range
             reg_end = block.base_address + reg1.address_offset + (reg1.size // 8)
@@ -135,13 +138,28 @@ class IpCoreValidator:
                 )
 
     @staticmethod
-    def _registers_overlap(reg1: RegisterDef, reg2: RegisterDef) -> bool:
-        """Check if two registers overlap."""
-        size1_bytes = reg1.size // 8
-        size2_bytes = reg2.size // 8
-        end1 = reg1.address_offset + size1_bytes
-        end2 = reg2.address_offset + size2_bytes
-        return not (end1 <= reg2.address_offset or end2 <= reg1.address_offset)
+    def _overlapping_pairs(registers: List[RegisterDef]) -> Dict[int, List[int]]:
+        """Map each register index to the later indices it overlaps.
+
+        Sweeps the registers in address order, so only neighbours that start
+        before the current register ends are compared.
+        """
+        spans = sorted(
+            (reg.address_offset, reg.address_offset + reg.size // 8, i)
+            for i, reg in enumerate(registers)
+        )
+        pairs: Dict[int, List[int]] = {}
+        for pos, (start1, end1, i) in enumerate(spans):
+            for k in range(pos + 1, len(spans)):
+                start2, end2, j = spans[k]
+                if start2 >= end1:
+                    break
+                if end2 > start1:
+                    first, second = (i, j) if i < j else (j, i)
+                    pairs.setdefault(first, []).append(second)
+        for later in pairs.values():
+            later.sort()
+        return pairs
 
     def _warn_missing_association(self, bus_name: str, signal_type: str) -> None:
         self.warnings.append(
@@ -10,9 +10,10 @@ from ipcraft.model import File, FileSet, FileType
 from ipcraft.utils import filter_none
 
 from .errors import ParseError
+from .protocols import ParserHostContext
 
 
-class FileSetParserMixin:
+class FileSetParserMixin(ParserHostContext):
     """Mixin implementing file set parsing and import behavior."""
 
     def _parse_file_sets(
@@ -48,10 +49,11 @@ class FileSetParserMixin:
         """Load file sets from an external YAML file."""
         if not file_path.exists():
             raise ParseError(f"FileSet file not found: {file_path}")
+        content = file_path.read_bytes()
+        self._record_import(file_path, content)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = yaml.safe_load(content)
         except yaml.YAMLError as e:
             raise ParseError(f"YAML syntax error in fileset file: {e}", file_path)
 
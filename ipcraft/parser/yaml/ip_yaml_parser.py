@@ -5,8 +5,11 @@ Loads YAML files and converts them to canonical Pydantic models.
 Supports imports, bus library loading, and memory map references.
 """
 
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import yaml
 from pydantic import ValidationError
@@ -28,9 +31,25 @@ from .errors import ParseError
 from .fileset_parser import FileSetParserMixin
 from .memory_map_parser import MemoryMapParserMixin
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=256)
+def _access_from_string(access: str) -> AccessType:
+    """Cached ``AccessType.from_string`` for the few access spellings in use."""
+    return AccessType.from_string(access)
+
+
+def _content_digest(content: bytes) -> bytes:
+    """Digest identifying a file's content for the ``parse_file`` cache."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
 class YamlIpCoreParser(MemoryMapParserMixin, FileSetParserMixin):
     """
     Parser for IP core YAML definitions.
@@ -43,8 +62,25 @@ class YamlIpCoreParser(MemoryMapParserMixin, FileSetParserMixin):
     - Validation and error reporting with line numbers
     """
 
-    def __init__(self):
-        self._register_templates: Dict[str, List[Dict[str, Any]]] = {}
+    # Number of parsed files kept by parse_file() per parser instance.
+    PARSED_FILES_CACHE_SIZE = 64
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize parser.
+
+        Args:
+            cache_dir: Optional directory for caching parsed memory map
+                files, keyed by a hash of their content. Disabled when None.
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._register_templates: Dict[str, Tuple[Any, ...]] = {}
+        self._compiled_templates: Dict[str, Tuple[Any, ...]] = {}
+        # Resolved path -> (content digest, imported file digests, IP core)
+        self._parsed_files: (
+            "OrderedDict[str, Tuple[bytes, Dict[str, bytes], IpCore]]"
+        ) = OrderedDict()
+        self._imported_files: Dict[str, bytes] = {}
         self._current_file: Optional[Path] = None
 
     @staticmethod
@@ -53,13 +89,17 @@ class YamlIpCoreParser(MemoryMapParserMixin, FileSetParserMixin):
         if isinstance(access, AccessType):
             return access
         if isinstance(access, str):
-            return AccessType.from_string(access)
+            return _access_from_string(access)
         return AccessType.READ_WRITE
 
     def parse_file(self, file_path: Union[str, Path]) -> IpCore:
         """
         Parse an IP core YAML file.
 
+        Results are cached per parser instance and reused while neither the
+        file nor any imported memory map or file set file has been modified;
+        each call returns a fresh deep copy.
+
         Args:
             file_path: Path to the IP core YAML file
 
@@ -75,9 +115,44 @@ class YamlIpCoreParser(MemoryMapParserMixin, FileSetParserMixin):
         if not file_path.exists():
             raise ParseError(f"File not found: {file_path}")
 
+        key = str(file_path)
+        digest = _content_digest(file_path.read_bytes())
+        cache = self._parsed_files
+        cached = cache.get(key)
+        if (
+            cached is None
+            or cached[0] != digest
+            or not self._imports_unchanged(cached[1])
+        ):
+            self._imported_files = {}
+            ip_core = self._parse_file_uncached(file_path)
+            cached = (digest, self._imported_files, ip_core)
+            cache[key] = cached
+            if len(cache) > self.PARSED_FILES_CACHE_SIZE:
+                cache.popitem(last=False)
+        cache.move_to_end(key)
+        return cached[2].model_copy(deep=True)
+
+    def _record_import(self, file_path: Path, content: bytes) -> None:
+        """Remember the content digest of a file imported while parsing."""
+        self._imported_files[str(file_path.resolve())] = _content_digest(content)
+
+    @staticmethod
+    def _imports_unchanged(imported_files: Dict[str, bytes]) -> bool:
+        """Check that imported files still have their recorded content."""
+        for path, digest in imported_files.items():
+            try:
+                if _content_digest(Path(path).read_bytes()) != digest:
+                    return False
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _parse_file_uncached(self, file_path: Path) -> IpCore:
+        """Load and validate ``file_path`` without consulting the cache."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             line = getattr(e, "problem_mark", None)
             line_num = line.line + 1 if line else None
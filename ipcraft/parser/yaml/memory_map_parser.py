@@ -1,29 +1,125 @@
 """Memory map parsing mixin for ``YamlIpCoreParser``."""
 
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from ipcraft import __version__
 from ipcraft.model import AddressBlock, MemoryMap
 from ipcraft.model.memory_map import BitFieldDef, RegisterDef, RegisterArrayDef
-from ipcraft.utils import parse_bit_range, filter_none
+from ipcraft.utils import parse_bit_range
 
 from .errors import ParseError
 from .protocols import ParserHostContext
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Interned defaults: they become keys of the cached access parser and are
+# compared for every register and field.
+_READ_WRITE = sys.intern("read-write")
+_REGISTER_USAGE = sys.intern("register")
+_DEFAULT_REG_NAME = sys.intern("REG")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached ``TypeAdapter`` validating a list of ``model_cls``."""
+    return TypeAdapter(List[model_cls])  # type: ignore[valid-type]
+
+
+def _non_none(**values: Any) -> Dict[str, Any]:
+    """Keyword-argument form of ``filter_none`` for model construction.
+
+    Avoids building a throwaway dict literal that is then filtered again.
+    """
+    return {k: v for k, v in values.items() if v is not None}
+
+
+def _read_cache_entry(cache_file: Path) -> Optional[List[MemoryMap]]:
+    """Load a cached memory map list, dropping entries that cannot be read."""
+    try:
+        data = cache_file.read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        return cast(List[MemoryMap], pickle.loads(data))
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Truncated or stale entry: discard it and parse the file again
+        cache_file.unlink(missing_ok=True)
+        return None
+
+
+def _write_cache_entry(cache_file: Path, memory_maps: List[MemoryMap]) -> None:
+    """Atomically store a memory map list so readers never see partial files."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(memory_maps, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class _RegisterTemplate(NamedTuple):
+    """One register entry of a ``registerTemplates`` definition."""
+
+    name: str
+    size: int
+    access: str
+    description: Optional[str]
+    reset_value: Optional[int]
+    fields_raw: List[Dict[str, Any]]
+
+
+class _CompiledRegister(NamedTuple):
+    """Register template entry pre-validated for array expansion."""
+
+    name_suffix: str
+    size_bytes: int
+    prototype: RegisterDef
+
 
 class MemoryMapParserMixin(ParserHostContext):
     """Mixin implementing memory map parsing and expansion logic."""
 
+    # State owned by this mixin, initialized by the host parser.
+    _register_templates: Dict[str, Tuple[_RegisterTemplate, ...]]
+    _compiled_templates: Dict[str, Tuple[_CompiledRegister, ...]]
+    _cache_dir: Optional[Path]
+
     def _build_register_def(
         self,
         *,
         name: str,
         address_offset: int,
         size: int = 32,
-        access: str = "read-write",
+        access: str = _READ_WRITE,
         description: str = None,
         reset_value: int = None,
         fields: list = None,
@@ -45,19 +141,28 @@ class MemoryMapParserMixin(ParserHostContext):
         Returns:
             Validated RegisterDef instance.
         """
-        return RegisterDef(
-            **filter_none(
-                {
-                    "name": name,
-                    "address_offset": address_offset,
-                    "size": size,
-                    "access": self._parse_access(access),
-                    "description": description,
-                    "reset_value": reset_value,
-                    "fields": fields if fields else None,
-                }
-            )
+        values = _non_none(
+            name=name,
+            address_offset=address_offset,
+            size=size,
+            access=self._parse_access(access),
+            description=description,
+            reset_value=reset_value,
+            fields=fields if fields else None,
         )
+        # Plain, in-range values (the common case) cannot fail validation:
+        # construct directly. Anything else goes through pydantic so the
+        # usual coercion and error messages apply.
+        if (
+            type(name) is str
+            and type(address_offset) is int
+            and address_offset >= 0
+            and type(size) is int
+            and (reset_value is None or type(reset_value) is int)
+            and (description is None or type(description) is str)
+        ):
+            return RegisterDef.model_construct(**values)
+        return RegisterDef(**values)
 
     def _parse_memory_maps(
         self, data: Union[Dict[str, Any], List[Dict[str, Any]]], file_path: Path
@@ -67,8 +172,7 @@ class MemoryMapParserMixin(ParserHostContext):
             return []
 
         if isinstance(data, dict) and "import" in data:
-            import_path = (file_path.parent / data["import"]).resolve()
-            return self._load_memory_maps_from_file(import_path)
+            return self._load_memory_maps_from_file(file_path.parent / data["import"])
 
         if isinstance(data, list):
             return self._parse_memory_map_list(data, file_path)
@@ -76,26 +180,73 @@ class MemoryMapParserMixin(ParserHostContext):
         raise ParseError("memoryMaps must be either {import: ...} or a list", file_path)
 
     def _load_memory_maps_from_file(self, file_path: Path) -> List[MemoryMap]:
-        """Load memory maps from an external YAML file."""
-        if not file_path.exists():
+        """Load memory maps from an external YAML file.
+
+        When the parser has a cache directory, the parsed result is pickled
+        under a hash of the file content and reused on later loads.
+        """
+        try:
+            content = file_path.read_bytes()
+        except FileNotFoundError:
             raise ParseError(f"Memory map file not found: {file_path}")
+        self._record_import(file_path, content)
+
+        cache_file = None
+        if self._cache_dir is not None:
+            digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+            cache_file = self._cache_dir / f"memmap-{__version__}-{digest}.pkl"
+            cached = _read_cache_entry(cache_file)
+            if cached is not None:
+                return cached
+
+        memory_maps = self._parse_memory_map_documents(content, file_path)
+
+        if cache_file is not None:
+            _write_cache_entry(cache_file, memory_maps)
+        return memory_maps
 
+    def _parse_memory_map_documents(
+        self, content: bytes, file_path: Path
+    ) -> List[MemoryMap]:
+        """Parse the YAML documents of a memory map file.
+
+        A leading ``registerTemplates`` document is followed by the map
+        document; otherwise the last document is the map. Documents are
+        loaded lazily, so anything after the map is never constructed.
+        """
+        templates = None
+        map_data: Any
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            docs = list(yaml.safe_load_all(content))
+            docs = yaml.load_all(content, Loader=_SafeLoader)
+            map_data = next(docs, [])
+            if isinstance(map_data, dict) and "registerTemplates" in map_data:
+                templates = map_data
+                map_data = next(docs, templates)
+            else:
+                for map_data in docs:
+                    pass
         except yaml.YAMLError as e:
             raise ParseError(f"YAML syntax error in memory map file: {e}", file_path)
 
-        if (
-            len(docs) > 1
-            and isinstance(docs[0], dict)
-            and "registerTemplates" in docs[0]
-        ):
-            self._register_templates = docs[0]["registerTemplates"]
-            map_data = docs[1]
-        else:
-            map_data = docs[-1] if docs else []
+        # A lone templates document is treated as the map itself.
+        if templates is not None and map_data is not templates:
+            self._register_templates = {
+                template_name: tuple(
+                    _RegisterTemplate(
+                        name=reg.get("name", ""),
+                        size=reg.get("size", 32),
+                        access=reg.get("access", _READ_WRITE),
+                        description=reg.get("description"),
+                        reset_value=reg.get("resetValue"),
+                        fields_raw=reg.get("fields", []),
+                    )
+                    for reg in template_regs
+                )
+                for template_name, template_regs in templates[
+                    "registerTemplates"
+                ].items()
+            }
+            self._compiled_templates = {}
 
         if isinstance(map_data, list):
             return self._parse_memory_map_list(map_data, file_path)
@@ -108,26 +259,23 @@ class MemoryMapParserMixin(ParserHostContext):
     ) -> List[MemoryMap]:
         """Parse list-form memory map definitions."""
         memory_maps = []
-        for idx, map_data in enumerate(data):
-            try:
+        idx = 0
+        try:
+            for idx, map_data in enumerate(data):
                 address_blocks = self._parse_address_blocks(
                     map_data.get("addressBlocks", []), file_path
                 )
                 memory_maps.append(
                     MemoryMap(
-                        **filter_none(
-                            {
-                                "name": map_data.get("name"),
-                                "description": map_data.get("description"),
-                                "address_blocks": (
-                                    address_blocks if address_blocks else None
-                                ),
-                            }
+                        **_non_none(
+                            name=map_data.get("name"),
+                            description=map_data.get("description"),
+                            address_blocks=address_blocks if address_blocks else None,
                         )
                     )
                 )
-            except (KeyError, TypeError, ValueError, ValidationError) as e:
-                raise ParseError(f"Error parsing memoryMap[{idx}]: {e}", file_path)
+        except (KeyError, TypeError, ValueError, ValidationError) as e:
+            raise ParseError(f"Error parsing memoryMap[{idx}]: {e}", file_path)
         return memory_maps
 
     def _parse_address_blocks(
@@ -135,50 +283,54 @@ class MemoryMapParserMixin(ParserHostContext):
     ) -> List[AddressBlock]:
         """Parse address blocks and nested register definitions."""
         blocks = []
-        for idx, block_data in enumerate(data):
-            try:
+        idx = 0
+        try:
+            for idx, block_data in enumerate(data):
                 base_address = block_data.get("baseAddress", 0)
-                registers = self._parse_registers(
+                registers, end_offset = self._parse_registers(
                     block_data.get("registers", []), file_path
                 )
 
                 range_value = block_data.get("range")
                 if range_value is None and registers:
-                    max_offset = max(
-                        reg.address_offset + (reg.size // 8) for reg in registers
-                    )
-                    range_value = max(max_offset, 64)
+                    range_value = max(end_offset, 64)
                 elif range_value is None:
                     range_value = 4096
 
                 blocks.append(
                     AddressBlock(
-                        **filter_none(
-                            {
-                                "name": block_data.get("name"),
-                                "base_address": base_address,
-                                "range": range_value,
-                                "description": block_data.get("description"),
-                                "usage": block_data.get("usage", "register"),
-                                "default_reg_width": block_data.get("defaultRegWidth"),
-                                "registers": registers if registers else None,
-                            }
+                        **_non_none(
+                            name=block_data.get("name"),
+                            base_address=base_address,
+                            range=range_value,
+                            description=block_data.get("description"),
+                            usage=block_data.get("usage", _REGISTER_USAGE),
+                            default_reg_width=block_data.get("defaultRegWidth"),
+                            registers=registers if registers else None,
                         )
                     )
                 )
-            except (KeyError, TypeError, ValueError, ValidationError) as e:
-                raise ParseError(f"Error parsing addressBlock[{idx}]: {e}", file_path)
+        except (KeyError, TypeError, ValueError, ValidationError) as e:
+            raise ParseError(f"Error parsing addressBlock[{idx}]: {e}", file_path)
         return blocks
 
     def _parse_registers(
         self, data: List[Dict[str, Any]], file_path: Path
-    ) -> List[Union[RegisterDef, RegisterArrayDef]]:
-        """Parse register definitions and expand array/template constructs."""
+    ) -> Tuple[List[Union[RegisterDef, RegisterArrayDef]], int]:
+        """Parse register definitions and expand array/template constructs.
+
+        Returns:
+            Tuple of the parsed registers and the end offset (in bytes) of
+            the highest register, used to size address blocks without a
+            second pass over the registers.
+        """
         registers = []
         current_offset = 0
+        end_offset = 0
 
-        for idx, reg_data in enumerate(data):
-            try:
+        idx = 0
+        try:
+            for idx, reg_data in enumerate(data):
                 if "reserved" in reg_data:
                     current_offset += reg_data["reserved"]
                     continue
@@ -187,19 +339,26 @@ class MemoryMapParserMixin(ParserHostContext):
                     # Construct RegisterArrayDef
                     count = reg_data.get("count", 1)
                     stride = reg_data.get("stride", 4)
-                    
-                    sub_regs = self._parse_registers(reg_data["registers"], file_path)
+
+                    sub_regs, _ = self._parse_registers(
+                        reg_data["registers"], file_path
+                    )
                     if not sub_regs:
-                        raise ParseError(f"Register array '{reg_data.get('name')}' has no sub-registers", file_path)
-                        
+                        raise ParseError(
+                            f"Register array '{reg_data.get('name')}' has no sub-registers",
+                            file_path,
+                        )
+
                     # Usually arrays have a single template register
                     template = sub_regs[0]
-                    
+
                     # Update current_offset before appending
-                    address_offset = reg_data.get("addressOffset") or reg_data.get("offset", current_offset)
-                    
+                    address_offset = reg_data.get("addressOffset") or reg_data.get(
+                        "offset", current_offset
+                    )
+
                     array_def = RegisterArrayDef(
-                        name=reg_data.get("name", "REG"),
+                        name=reg_data.get("name", _DEFAULT_REG_NAME),
                         base_address=address_offset,
                         count=count,
                         stride=stride,
@@ -208,16 +367,18 @@ class MemoryMapParserMixin(ParserHostContext):
                     )
                     registers.append(array_def)
                     current_offset = address_offset + (count * stride)
+                    end_offset = max(end_offset, current_offset)
                     continue
 
                 if "generateArray" in reg_data:
-                    expanded_regs = self._expand_register_array(
+                    expanded_regs, array_end = self._expand_register_array(
                         reg_data["generateArray"], current_offset, file_path
                     )
+                    num_registers = len(registers)
                     registers.extend(expanded_regs)
-                    if expanded_regs:
-                        last_reg = expanded_regs[-1]
-                        current_offset = last_reg.address_offset + (last_reg.size // 8)
+                    if len(registers) > num_registers:
+                        current_offset = array_end
+                        end_offset = max(end_offset, current_offset)
                     continue
 
                 address_offset = reg_data.get("addressOffset") or reg_data.get("offset")
@@ -232,23 +393,33 @@ class MemoryMapParserMixin(ParserHostContext):
                         name=reg_data.get("name"),
                         address_offset=address_offset,
                         size=size,
-                        access=reg_data.get("access", "read-write"),
+                        access=reg_data.get("access", _READ_WRITE),
                         description=reg_data.get("description"),
                         reset_value=reg_data.get("resetValue"),
                         fields=fields,
                     )
                 )
                 current_offset = address_offset + (size // 8)
-            except (KeyError, TypeError, ValueError, ValidationError) as e:
-                raise ParseError(f"Error parsing register[{idx}]: {e}", file_path)
+                end_offset = max(end_offset, current_offset)
+        except (KeyError, TypeError, ValueError, ValidationError) as e:
+            raise ParseError(f"Error parsing register[{idx}]: {e}", file_path)
 
-        return registers
+        return registers, end_offset
 
     def _expand_register_array(
         self, array_spec: Dict[str, Any], start_offset: int, file_path: Path
-    ) -> List[RegisterDef]:
-        """Expand legacy ``generateArray`` register templates."""
-        base_name = array_spec.get("name", "REG")
+    ) -> Tuple[Iterator[RegisterDef], int]:
+        """Expand legacy ``generateArray`` register templates.
+
+        The template is validated eagerly; the registers themselves are
+        produced lazily so callers can extend their list without an
+        intermediate copy.
+
+        Returns:
+            Tuple of an iterator over the expanded registers and the offset
+            just past the last one.
+        """
+        base_name = array_spec.get("name", _DEFAULT_REG_NAME)
         count = array_spec.get("count", 1)
         template_name = array_spec.get("template")
 
@@ -260,54 +431,98 @@ class MemoryMapParserMixin(ParserHostContext):
                 file_path,
             )
 
-        template = self._register_templates[template_name]
-        registers = []
-        current_offset = start_offset
-
-        for instance_idx in range(count):
-            instance_num = instance_idx + 1
-            for template_reg in template:
-                reg_name = template_reg.get("name", "")
-                reg_name = (
-                    f"{base_name}{instance_num}{reg_name}"
-                    if reg_name.startswith("_")
-                    else f"{base_name}{instance_num}_{reg_name}"
-                )
+        compiled = self._compile_register_template(template_name, file_path)
+        instance_bytes = sum(reg.size_bytes for reg in compiled)
+        return (
+            self._iter_array_instances(compiled, base_name, count, start_offset),
+            start_offset + count * instance_bytes,
+        )
 
-                size = template_reg.get("size", 32)
-                fields = self._parse_bit_fields(
-                    template_reg.get("fields", []), file_path
+    @staticmethod
+    def _iter_array_instances(
+        compiled: Tuple[_CompiledRegister, ...],
+        base_name: str,
+        count: int,
+        offset: int,
+    ) -> Iterator[RegisterDef]:
+        """Yield the registers of ``count`` consecutive template instances."""
+        for instance_num in range(1, count + 1):
+            for reg in compiled:
+                # model_copy is shallow: give each instance its own fields,
+                # since BitFieldDef is mutable and must not be aliased.
+                yield reg.prototype.model_copy(
+                    update={
+                        "name": f"{base_name}{instance_num}{reg.name_suffix}",
+                        "address_offset": offset,
+                        "fields": [
+                            field.model_copy(deep=True)
+                            for field in reg.prototype.fields
+                        ],
+                        "registers": [],
+                    }
                 )
+                offset += reg.size_bytes
 
-                registers.append(
-                    self._build_register_def(
-                        name=reg_name,
-                        address_offset=current_offset,
-                        size=size,
-                        access=template_reg.get("access", "read-write"),
-                        description=template_reg.get("description"),
-                        reset_value=template_reg.get("resetValue"),
-                        fields=fields,
-                    )
+    def _compile_register_template(
+        self, template_name: str, file_path: Path
+    ) -> Tuple[_CompiledRegister, ...]:
+        """Validate a register template once and cache it for array expansion.
+
+        Array instances only differ by name and address offset, so every
+        instance of every ``generateArray`` using the template reuses the
+        same validated prototypes.
+        """
+        compiled = self._compiled_templates.get(template_name)
+        if compiled is not None:
+            return compiled
+
+        compiled_regs = []
+        for template_reg in self._register_templates[template_name]:
+            prototype = self._build_register_def(
+                name=template_reg.name,
+                address_offset=0,
+                size=template_reg.size,
+                access=template_reg.access,
+                description=template_reg.description,
+                reset_value=template_reg.reset_value,
+                fields=self._parse_bit_fields(template_reg.fields_raw, file_path),
+            )
+            reg_name = template_reg.name
+            compiled_regs.append(
+                _CompiledRegister(
+                    name_suffix=(
+                        reg_name if reg_name.startswith("_") else f"_{reg_name}"
+                    ),
+                    size_bytes=prototype.size // 8,
+                    prototype=prototype,
                 )
-                current_offset += size // 8
+            )
 
-        return registers
+        compiled = tuple(compiled_regs)
+        self._compiled_templates[template_name] = compiled
+        return compiled
 
     def _parse_bit_fields(
         self, data: List[Dict[str, Any]], file_path: Path
     ) -> List[BitFieldDef]:
-        """Parse bit-field definitions from register entries."""
-        fields = []
+        """Parse bit-field definitions from register entries.
+
+        Offsets are resolved in Python, then all fields of the register are
+        validated in a single ``TypeAdapter`` call.
+        """
+        payloads = []
         current_bit = 0
 
-        for idx, field_data in enumerate(data):
-            try:
+        idx = 0
+        try:
+            for idx, field_data in enumerate(data):
                 if "bits" in field_data:
                     try:
                         bit_offset, bit_width = parse_bit_range(field_data["bits"])
                     except ValueError as e:
-                        raise ValueError(f"Failed to parse bits notation '{field_data['bits']}': {e}")
+                        raise ValueError(
+                            f"Failed to parse bits notation '{field_data['bits']}': {e}"
+                        )
                 else:
                     bit_offset = field_data.get("bitOffset")
                     bit_width = field_data.get("bitWidth", 1)
@@ -317,27 +532,30 @@ class MemoryMapParserMixin(ParserHostContext):
                 if bit_width is None:
                     bit_width = 1
 
-                access_type = self._parse_access(field_data.get("access", "read-write"))
-
-                fields.append(
-                    BitFieldDef(
-                        **filter_none(
-                            {
-                                "name": field_data.get("name"),
-                                "bit_offset": bit_offset,
-                                "bit_width": bit_width,
-                                "access": access_type,
-                                "description": field_data.get("description"),
-                                "reset_value": field_data.get("resetValue")
-                                or field_data.get("reset"),
-                            }
-                        )
+                access_type = self._parse_access(field_data.get("access", _READ_WRITE))
+
+                payloads.append(
+                    _non_none(
+                        name=field_data.get("name"),
+                        bit_offset=bit_offset,
+                        bit_width=bit_width,
+                        access=access_type,
+                        description=field_data.get("description"),
+                        reset_value=field_data.get("resetValue")
+                        or field_data.get("reset"),
                     )
                 )
                 current_bit = bit_offset + bit_width
-            except (KeyError, TypeError, ValueError, ValidationError) as e:
-                raise ParseError(f"Error parsing bitField[{idx}]: {e}", file_path)
-
-        return fields
-
+        except (KeyError, TypeError, ValueError) as e:
+            raise ParseError(f"Error parsing bitField[{idx}]: {e}", file_path)
 
+        try:
+            return cast(
+                List[BitFieldDef],
+                _list_adapter(BitFieldDef).validate_python(payloads),
+            )
+        except ValidationError as e:
+            loc = e.errors()[0]["loc"]
+            if loc and isinstance(loc[0], int):
+                raise ParseError(f"Error parsing bitField[{loc[0]}]: {e}", file_path)
+            raise ParseError(f"Error parsing bitFields: {e}", file_path)
@@ -1,5 +1,6 @@
 """Typing protocols for parser mixins."""
 
+from pathlib import Path
 from typing import Any, Protocol
 
 from ipcraft.model import AccessType
@@ -11,3 +12,7 @@ class ParserHostContext(Protocol):
     def _parse_access(self, access: Any) -> AccessType:
         """Parse an access type string/enum."""
         ...
+
+    def _record_import(self, file_path: Path, content: bytes) -> None:
+        """Record an imported file for cache invalidation."""
+        ...
@@ -14,6 +14,7 @@ from .register import (
     Register,
     RegisterArrayAccessor,
     RuntimeAccessType,
+    rmw_batch,
 )
 
 __all__ = [
@@ -25,4 +26,5 @@ __all__ = [
     "AbstractBusInterface",
     "AsyncBusInterface",
     "RegisterArrayAccessor",
+    "rmw_batch",
 ]
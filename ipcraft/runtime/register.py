@@ -6,12 +6,24 @@ used by any IP core driver implementation. These classes handle bit-wise
 operations, field validation, and access control.
 """
 
+import asyncio
+import inspect
 import logging
+import sys
 import warnings
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +47,27 @@ class RuntimeAccessType(str, Enum):
     RW1C = "rw1c"  # Read-write-1-to-clear
 
 
-@dataclass
+# Integer access codes compared on the RMW hot path instead of strings
+_RO, _WO, _RW, _RW1C = range(4)
+_ACCESS_CODE = {
+    RuntimeAccessType.RO: _RO,
+    RuntimeAccessType.WO: _WO,
+    RuntimeAccessType.RW: _RW,
+    RuntimeAccessType.RW1C: _RW1C,
+}
+_VALID_ACCESS = frozenset(at.value for at in RuntimeAccessType)
+
+
+# __slots__ generation for dataclasses needs Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BitField:
     """
-    Represents a bit field within a register.
+    Represents an immutable bit field within a register.
     """
 
     MAX_REGISTER_WIDTH: ClassVar[int] = 64
@@ -50,31 +79,38 @@ class BitField:
     description: str = ""
     reset_value: Optional[int] = None
 
+    # Derived in __post_init__
+    _access_code: int = field(init=False, repr=False, compare=False)
+    _value_mask: int = field(init=False, repr=False, compare=False)
+    _mask: int = field(init=False, repr=False, compare=False)
+
     @property
     def mask(self) -> int:
         """Get the bit mask for this field within the register."""
-        return ((1 << self.width) - 1) << self.offset
+        return self._mask
 
     @property
     def max_value(self) -> int:
         """Get the maximum value that can be stored in this field."""
-        return (1 << self.width) - 1
+        return self._value_mask
 
     def extract_value(self, register_value: int) -> int:
         """Extract this field's value from a complete register value."""
-        return (register_value >> self.offset) & ((1 << self.width) - 1)
+        return (register_value >> self.offset) & self._value_mask
 
     def __post_init__(self):
         """Validate bit field parameters."""
-        valid_access = {at.value for at in RuntimeAccessType}
         # Check if access is string and valid
         acc_val = (
             self.access.value
             if isinstance(self.access, RuntimeAccessType)
             else self.access
         )
-        if acc_val not in valid_access:
-            raise ValueError(f"access must be one of {valid_access}")
+        if acc_val not in _VALID_ACCESS:
+            raise ValueError(f"access must be one of {set(_VALID_ACCESS)}")
+        access = RuntimeAccessType(acc_val)
+        object.__setattr__(self, "access", access)
+        object.__setattr__(self, "_access_code", _ACCESS_CODE[access])
 
         if self.width <= 0:
             raise ValueError(f"Bit field '{self.name}' width must be positive")
@@ -91,12 +127,15 @@ class BitField:
                 f"{self.MAX_REGISTER_WIDTH}-bit register boundary"
             )
 
+        # Masks depend only on offset/width; compute them once
+        value_mask = (1 << self.width) - 1
+        object.__setattr__(self, "_value_mask", value_mask)
+        object.__setattr__(self, "_mask", value_mask << self.offset)
+
     def insert_value(self, register_value: int, field_value: int) -> int:
         """Insert this field's value into a complete register value."""
-        # Clear the field bits
-        cleared_value = register_value & ~self.mask
-        # Insert the new field value
-        return cleared_value | ((field_value << self.offset) & self.mask)
+        mask = self._mask
+        return (register_value & ~mask) | ((field_value << self.offset) & mask)
 
 
 class AbstractBusInterface(ABC):
@@ -152,15 +191,17 @@ class RegisterBoundField:
     Helper class to provide access to a specific field within a register instance.
     """
 
+    __slots__ = ("_register", "_field_def")
+
     def __init__(self, register: "Register", field_def: BitField):
         self._register = register
         self._field_def = field_def
 
     def read(self) -> int:
-        return self._register.read_field(self._field_def.name)
+        return self._register._read_field_obj(self._field_def)
 
     def write(self, value: int) -> None:
-        self._register.write_field(self._field_def.name, value)
+        self._register._write_field_obj(self._field_def, value)
 
     def __int__(self) -> int:
         return self.read()
@@ -172,8 +213,25 @@ class RegisterBoundField:
         return str(self.read())
 
 
+def _warn_rmw_read_failed(
+    reg_name: str, exc: BaseException, operation: str = "RMW"
+) -> None:
+    """Log a failed RMW read; skipped entirely when WARNING is disabled."""
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Failed to read register '%s' during %s: %s; "
+            "proceeding with current_value=0 — other fields may be corrupted",
+            reg_name,
+            operation,
+            exc,
+        )
+
+
 def _build_rmw_value(
-    fields_dict: Dict[str, BitField], field_values: Dict[str, int], current_reg_val: int
+    fields_dict: Dict[str, BitField],
+    field_values: Dict[str, int],
+    current_reg_val: int,
+    preserve_mask: int,
 ) -> int:
     """
     Build register write value preserving non-target fields safely.
@@ -184,6 +242,7 @@ def _build_rmw_value(
         fields_dict: Dictionary mapping field names to BitField definitions
         field_values: Dictionary of field names to new values to write
         current_reg_val: Current register value (from read operation)
+        preserve_mask: Bits of RW fields kept from current_reg_val when not written
 
     Returns:
         Computed register value with updated fields and preserved RW fields
@@ -192,20 +251,20 @@ def _build_rmw_value(
         ValueError: If a field value exceeds its width
     """
     reg_val_to_write = 0
-    for f_name, field in fields_dict.items():
-        if f_name in field_values:
-            value = field_values[f_name]
-            if value > field.max_value:
-                raise ValueError(f"Value {value} exceeds field '{f_name}' width")
-            reg_val_to_write = field.insert_value(reg_val_to_write, value)
+    written_mask = 0
+    get_field = fields_dict.get
+    for f_name, value in field_values.items():
+        field = get_field(f_name)
+        if field is None:
             continue
+        if value > field._value_mask:
+            raise ValueError(f"Value {value} exceeds field '{f_name}' width")
+        mask = field._mask
+        written_mask |= mask
+        reg_val_to_write = (reg_val_to_write & ~mask) | ((value << field.offset) & mask)
 
-        field_access = str(field.access)
-        if field_access == RuntimeAccessType.RW.value:
-            preserved = field.extract_value(current_reg_val)
-            reg_val_to_write = field.insert_value(reg_val_to_write, preserved)
-
-    return reg_val_to_write
+    # Untouched RW fields keep their bits in place in a single mask operation
+    return reg_val_to_write | (current_reg_val & preserve_mask & ~written_mask)
 
 
 class AsyncRegisterBoundField:
@@ -213,15 +272,17 @@ class AsyncRegisterBoundField:
     Helper class for async field access.
     """
 
+    __slots__ = ("_register", "_field_def")
+
     def __init__(self, register: "AsyncRegister", field_def: BitField):
         self._register = register
         self._field_def = field_def
 
     async def read(self) -> int:
-        return await self._register.read_field(self._field_def.name)
+        return await self._register._read_field_obj(self._field_def)
 
     async def write(self, value: int) -> None:
-        await self._register.write_field(self._field_def.name, value)
+        await self._register._write_field_obj(self._field_def, value)
 
 
 class _RegisterBase:
@@ -229,6 +290,13 @@ class _RegisterBase:
 
     This base class centralizes logic common to both synchronous and
     asynchronous register implementations, eliminating code duplication.
+
+    ``bus_width_bits`` sets the width of a bus word; written values are
+    truncated to it.
+
+    With ``cache_reads=True`` the last known register value is reused instead
+    of reading the bus again, which helps on slow links. Call
+    ``invalidate_cache()`` when hardware may have changed the register.
     """
 
     def __init__(
@@ -238,60 +306,90 @@ class _RegisterBase:
         bus: Union[AbstractBusInterface, AsyncBusInterface],
         fields: List[BitField],
         description: str = "",
+        cache_reads: bool = False,
+        bus_width_bits: int = 32,
     ):
         self.name = name
         self.offset = offset
         self.description = description
         self._bus = bus
+        self._word_mask = (1 << bus_width_bits) - 1
         self._fields: Dict[str, BitField] = {f.name: f for f in fields}
+        # Fields are fixed after construction, so derive these once.
+        # (name, offset, value mask) of readable fields for bulk extraction:
+        self._readable_layout = tuple(
+            (f.name, f.offset, f._value_mask)
+            for f in self._fields.values()
+            if f._access_code != _WO
+        )
+        # Bits an RMW must read back; if a write covers them all, skip the read
+        self._preserve_mask = 0
+        for f in self._fields.values():
+            if f._access_code == _RW:
+                self._preserve_mask |= f._mask
+        # Last known register value, only maintained when cache_reads is set.
+        # A written value only matches a later read if every field is RW:
+        # RO, RW1C and WO bits do not read back what was written.
+        self._cache_reads = cache_reads
+        self._cached: Optional[int] = None
+        self._cache_on_write = cache_reads and all(
+            f._access_code == _RW for f in self._fields.values()
+        )
+        value = 0
+        for f in self._fields.values():
+            if f.reset_value is not None:
+                value = f.insert_value(value, f.reset_value)
+        self._reset_value = value
 
     @property
     def reset_value(self) -> int:
-        """Calculate the register's reset value from its fields."""
-        value = 0
-        for field in self._fields.values():
-            if field.reset_value is not None:
-                value = field.insert_value(value, field.reset_value)
-        return value
+        """Get the register's reset value computed from its fields."""
+        return self._reset_value
 
-    def _validate_readable(self, field_name: str) -> BitField:
-        """Validate that a field exists and is readable.
+    @staticmethod
+    def _validate_readable(field: BitField) -> None:
+        """Validate that a field is readable.
 
         Args:
-            field_name: Name of the field to validate.
-
-        Returns:
-            The validated BitField object.
+            field: Field to validate.
 
         Raises:
-            KeyError: If field not found.
             ValueError: If field is write-only.
         """
-        field = self._fields[field_name]
-        if str(field.access) == RuntimeAccessType.WO.value:
-            raise ValueError(f"Field '{field_name}' is write-only")
-        return field
+        if field._access_code == _WO:
+            raise ValueError(f"Field '{field.name}' is write-only")
 
-    def _validate_writable(self, field_name: str, value: int) -> BitField:
-        """Validate that a field exists, is writable, and the value fits.
+    @staticmethod
+    def _validate_writable(field: BitField, value: int) -> None:
+        """Validate that a field is writable and the value fits.
 
         Args:
-            field_name: Name of the field to validate.
+            field: Field to validate.
             value: Value to write.
 
-        Returns:
-            The validated BitField object.
-
         Raises:
-            KeyError: If field not found.
             ValueError: If field is read-only or value exceeds width.
         """
-        field = self._fields[field_name]
-        if str(field.access) == RuntimeAccessType.RO.value:
-            raise ValueError(f"Field '{field_name}' is read-only")
-        if value > field.max_value:
-            raise ValueError(f"Value {value} exceeds field '{field_name}' width")
-        return field
+        if field._access_code == _RO:
+            raise ValueError(f"Field '{field.name}' is read-only")
+        if value > field._value_mask:
+            raise ValueError(f"Value {value} exceeds field '{field.name}' width")
+
+    def _needs_read(self, field_values: Dict[str, int]) -> bool:
+        """Check whether writing these fields leaves RW bits to preserve."""
+        written_mask = 0
+        for f_name in field_values:
+            if f_name in self._fields:
+                written_mask |= self._fields[f_name]._mask
+        return bool(self._preserve_mask & ~written_mask)
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached register value so the next read hits the bus."""
+        self._cached = None
+
+    def _update_cache(self, value: int) -> None:
+        """Record a written value, or drop it if readback would differ."""
+        self._cached = value if self._cache_on_write else None
 
     def get_field_names(self) -> List[str]:
         """Get all field names in this register."""
@@ -316,69 +414,84 @@ class Register(_RegisterBase):
         bus: AbstractBusInterface,
         fields: List[BitField],
         description: str = "",
+        cache_reads: bool = False,
+        bus_width_bits: int = 32,
     ):
-        super().__init__(name, offset, bus, fields, description)
-        # Create bound field attributes for easy access
-        for field in fields:
-            setattr(self, field.name, RegisterBoundField(self, field))
+        super().__init__(
+            name, offset, bus, fields, description, cache_reads, bus_width_bits
+        )
+        # Create bound field attributes for easy access in one dict update
+        self.__dict__.update(
+            {field.name: RegisterBoundField(self, field) for field in fields}
+        )
 
     def read(self) -> int:
         """Read the entire register value."""
-        return self._bus.read_word(self.offset)
+        if self._cached is not None:
+            return self._cached
+        val = self._bus.read_word(self.offset)
+        if self._cache_reads:
+            self._cached = val
+        return val
 
     def write(self, value: int) -> None:
         """Write the entire register value."""
-        self._bus.write_word(self.offset, value & 0xFFFFFFFF)
+        value &= self._word_mask
+        self._bus.write_word(self.offset, value)
+        if self._cache_reads:
+            self._update_cache(value)
 
     def read_field(self, field_name: str) -> int:
         """Read a specific bit field."""
-        field = self._validate_readable(field_name)
-        reg_val = self.read()
-        return field.extract_value(reg_val)
+        return self._read_field_obj(self._fields[field_name])
 
     def write_field(self, field_name: str, value: int) -> None:
         """Write a specific bit field (Read-Modify-Write)."""
-        self._validate_writable(field_name, value)
+        self._write_field_obj(self._fields[field_name], value)
+
+    def _read_field_obj(self, field: BitField) -> int:
+        """Read a field given its BitField, skipping the name lookup."""
+        self._validate_readable(field)
+        return (self.read() >> field.offset) & field._value_mask
+
+    def _write_field_obj(self, field: BitField, value: int) -> None:
+        """Write a field given its BitField, skipping the name lookup."""
+        self._validate_writable(field, value)
 
         current_reg_val = 0
         try:
-            current_reg_val = self.read()
+            if self._preserve_mask & ~field._mask:
+                current_reg_val = self.read()
         except BusIOError as exc:
-            logger.warning(
-                "Failed to read register '%s' during RMW: %s; "
-                "proceeding with current_value=0 — other fields may be corrupted",
-                self.name,
-                exc,
-            )
+            _warn_rmw_read_failed(self.name, exc)
 
-        reg_val_to_write = _build_rmw_value(
-            self._fields, {field_name: value}, current_reg_val
+        # Keep the other RW fields, write the target, send 0 to the rest
+        mask = field._mask
+        reg_val_to_write = (current_reg_val & self._preserve_mask & ~mask) | (
+            (value << field.offset) & mask
         )
         self.write(reg_val_to_write)
 
     def read_all_fields(self) -> Dict[str, int]:
         """Read all readable fields in the register."""
         reg_value = self.read()
-        result = {}
-        for field_name, field in self._fields.items():
-            if field.access != "wo":
-                result[field_name] = field.extract_value(reg_value)
-        return result
+        return {
+            field_name: (reg_value >> offset) & value_mask
+            for field_name, offset, value_mask in self._readable_layout
+        }
 
     def write_multiple_fields(self, field_values: Dict[str, int]) -> None:
         """Write multiple fields in a single register operation."""
         current_reg_val = 0
         try:
-            current_reg_val = self.read()
+            if self._needs_read(field_values):
+                current_reg_val = self.read()
         except BusIOError as exc:
-            logger.warning(
-                "Failed to read register '%s' during RMW: %s; "
-                "proceeding with current_value=0 — other fields may be corrupted",
-                self.name,
-                exc,
-            )
+            _warn_rmw_read_failed(self.name, exc)
 
-        reg_val_to_write = _build_rmw_value(self._fields, field_values, current_reg_val)
+        reg_val_to_write = _build_rmw_value(
+            self._fields, field_values, current_reg_val, self._preserve_mask
+        )
         self.write(reg_val_to_write)
 
 
@@ -394,62 +507,142 @@ class AsyncRegister(_RegisterBase):
         bus: AsyncBusInterface,
         fields: List[BitField],
         description: str = "",
+        cache_reads: bool = False,
+        bus_width_bits: int = 32,
     ):
-        super().__init__(name, offset, bus, fields, description)
-        for field in fields:
-            setattr(self, field.name, AsyncRegisterBoundField(self, field))
+        super().__init__(
+            name, offset, bus, fields, description, cache_reads, bus_width_bits
+        )
+        self.__dict__.update(
+            {field.name: AsyncRegisterBoundField(self, field) for field in fields}
+        )
 
     async def read(self) -> int:
         """Read the entire register value."""
+        if self._cached is not None:
+            return self._cached
+        # Checked per call: bus methods may be swapped or wrapped at any time
         val = self._bus.read_word(self.offset)
-        if hasattr(val, "__await__"):
-            return await val
+        if inspect.isawaitable(val):
+            val = await val
+        if self._cache_reads:
+            self._cached = val
         return val
 
     async def write(self, value: int) -> None:
         """Write the entire register value."""
-        res = self._bus.write_word(self.offset, value & 0xFFFFFFFF)
-        if hasattr(res, "__await__"):
+        value &= self._word_mask
+        res = self._bus.write_word(self.offset, value)
+        if inspect.isawaitable(res):
             await res
+        if self._cache_reads:
+            self._update_cache(value)
 
     async def read_field(self, field_name: str) -> int:
         """Read a specific bit field."""
-        field = self._validate_readable(field_name)
-        reg_val = await self.read()
-        return field.extract_value(reg_val)
+        return await self._read_field_obj(self._fields[field_name])
 
     async def write_field(self, field_name: str, value: int) -> None:
         """Write a specific bit field (Read-Modify-Write)."""
-        self._validate_writable(field_name, value)
+        await self._write_field_obj(self._fields[field_name], value)
+
+    async def _read_field_obj(self, field: BitField) -> int:
+        """Read a field given its BitField, skipping the name lookup."""
+        self._validate_readable(field)
+        return ((await self.read()) >> field.offset) & field._value_mask
+
+    async def _write_field_obj(self, field: BitField, value: int) -> None:
+        """Write a field given its BitField, skipping the name lookup."""
+        self._validate_writable(field, value)
 
         current_reg_val = 0
         try:
-            current_reg_val = await self.read()
+            if self._preserve_mask & ~field._mask:
+                current_reg_val = await self.read()
         except BusIOError as exc:
-            logger.warning(
-                "Failed to read register '%s' during async RMW: %s; "
-                "proceeding with current_value=0 — other fields may be corrupted",
-                self.name,
-                exc,
-            )
+            _warn_rmw_read_failed(self.name, exc, "async RMW")
 
-        reg_val_to_write = _build_rmw_value(
-            self._fields, {field_name: value}, current_reg_val
+        # Keep the other RW fields, write the target, send 0 to the rest
+        mask = field._mask
+        reg_val_to_write = (current_reg_val & self._preserve_mask & ~mask) | (
+            (value << field.offset) & mask
         )
         await self.write(reg_val_to_write)
 
 
+async def rmw_batch(
+    updates: Sequence[Tuple[AsyncRegister, Dict[str, int]]],
+) -> None:
+    """Write fields across several async registers with concurrent bus I/O.
+
+    All required reads are issued together, new values are computed, and
+    then all writes are issued together. This pays off on buses that allow
+    outstanding transactions.
+
+    Updates to the same register are merged into one read-modify-write,
+    with later values winning for repeated fields.
+
+    Args:
+        updates: Pairs of register and the field values to write into it.
+
+    Raises:
+        ValueError: If a field value exceeds its width.
+        BusIOError: If any write fails, after all writes have completed.
+    """
+    merged: Dict[int, Tuple[AsyncRegister, Dict[str, int]]] = {}
+    for reg, values in updates:
+        entry = merged.get(id(reg))
+        if entry is None:
+            merged[id(reg)] = (reg, dict(values))
+        else:
+            entry[1].update(values)
+    updates = list(merged.values())
+
+    to_read = [reg for reg, values in updates if reg._needs_read(values)]
+    results = await asyncio.gather(
+        *(reg.read() for reg in to_read), return_exceptions=True
+    )
+    current: Dict[int, int] = {}
+    for reg, result in zip(to_read, results):
+        if isinstance(result, BusIOError):
+            _warn_rmw_read_failed(reg.name, result, "async RMW")
+            result = 0
+        elif isinstance(result, BaseException):
+            raise result
+        current[id(reg)] = result
+
+    new_values = [
+        _build_rmw_value(
+            reg._fields, values, current.get(id(reg), 0), reg._preserve_mask
+        )
+        for reg, values in updates
+    ]
+    results = await asyncio.gather(
+        *(reg.write(value) for (reg, _), value in zip(updates, new_values)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 # Backward-compatible alias (DEPRECATED)
 # Use RuntimeAccessType directly to avoid confusion with model.memory.AccessType
+_ACCESSTYPE_WARNED = False
+
+
 def __getattr__(name: str) -> Any:
+    global _ACCESSTYPE_WARNED
     if name == "AccessType":
-        warnings.warn(
-            "'AccessType' alias is deprecated. Use 'RuntimeAccessType' instead to avoid "
-            "confusion with ipcraft.model.memory_map.AccessType. This alias will be removed "
-            "in a future version.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        if not _ACCESSTYPE_WARNED:
+            _ACCESSTYPE_WARNED = True
+            warnings.warn(
+                "'AccessType' alias is deprecated. Use 'RuntimeAccessType' instead to avoid "
+                "confusion with ipcraft.model.memory_map.AccessType. This alias will be removed "
+                "in a future version.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         return RuntimeAccessType
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
@@ -476,19 +669,26 @@ class RegisterArrayAccessor:
         self._stride = stride
         self._field_template = field_template
         self._register_class = register_class
+        # Elements are built lazily on first access and reused afterwards
+        self._cache: Dict[int, Union[Register, AsyncRegister]] = {}
 
     def __getitem__(self, index: int) -> Union[Register, AsyncRegister]:
+        reg = self._cache.get(index)
+        if reg is not None:
+            return reg
         if not (0 <= index < self._count):
             raise IndexError(f"Index {index} out of bounds")
 
         item_offset = self._base_offset + (index * self._stride)
-        return self._register_class(
+        reg = self._register_class(
             name=f"{self._name}[{index}]",
             offset=item_offset,
             bus=self._bus,
             fields=self._field_template,
             description=f"Element {index} of {self._name} array",
         )
+        self._cache[index] = reg
+        return reg
 
     def __len__(self) -> int:
         return self._count
@@ -17,7 +17,10 @@ class FailingBus(AbstractBusInterface):
 
 class TestRMWWithBusError:
     def test_write_field_logs_warning_on_bus_error(self, caplog):
-        fields = [BitField(name="ENABLE", offset=0, width=1, access="rw")]
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1, access="rw"),
+            BitField(name="MODE", offset=1, width=2, access="rw"),
+        ]
         reg = Register("CTRL", 0x00, FailingBus(), fields)
 
         with caplog.at_level(logging.WARNING):
@@ -38,7 +41,10 @@ class TestRMWWithBusError:
             def write_word(self, address: int, data: int) -> None:
                 pass
 
-        fields = [BitField(name="ENABLE", offset=0, width=1, access="rw")]
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1, access="rw"),
+            BitField(name="MODE", offset=1, width=2, access="rw"),
+        ]
         reg = Register("CTRL", 0x00, BrokenBus(), fields)
         with pytest.raises(TypeError, match="this is a bug"):
             reg.write_field("ENABLE", 1)
@@ -0,0 +1,259 @@
+import asyncio
+import functools
+
+import pytest
+
+from ipcraft.runtime.register import (
+    AbstractBusInterface,
+    AsyncBusInterface,
+    AsyncRegister,
+    BitField,
+    Register,
+    RegisterArrayAccessor,
+    rmw_batch,
+)
+
+
+class CountingBus(AbstractBusInterface):
+    """Bus backed by a dict that counts reads and writes."""
+
+    def __init__(self):
+        self.memory = {}
+        self.reads = 0
+        self.writes = 0
+
+    def read_word(self, address: int) -> int:
+        self.reads += 1
+        return self.memory.get(address, 0)
+
+    def write_word(self, address: int, data: int) -> None:
+        self.writes += 1
+        self.memory[address] = data
+
+
+class AsyncDictBus(AsyncBusInterface):
+    """Coroutine bus backed by a dict."""
+
+    def __init__(self):
+        self.memory = {}
+
+    async def read_word(self, address: int) -> int:
+        return self.memory.get(address, 0)
+
+    async def write_word(self, address: int, data: int) -> None:
+        self.memory[address] = data
+
+
+class TestReadCache:
+    def _fields(self, status_access="rw"):
+        return [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="MODE", offset=4, width=4),
+            BitField(name="STATUS", offset=8, width=1, access=status_access),
+        ]
+
+    def test_back_to_back_writes_skip_read(self):
+        bus = CountingBus()
+        bus.memory[0x10] = 0x100
+        reg = Register("CTRL", 0x10, bus, self._fields(), cache_reads=True)
+
+        reg.write_field("ENABLE", 1)
+        reg.write_field("MODE", 3)
+
+        assert bus.reads == 1
+        assert bus.memory[0x10] == 0x131
+        assert reg.read_field("MODE") == 3
+        assert bus.reads == 1
+
+    def test_invalidate_cache_forces_read(self):
+        bus = CountingBus()
+        reg = Register("CTRL", 0x10, bus, self._fields(), cache_reads=True)
+
+        reg.read()
+        bus.memory[0x10] = 0x5
+        assert reg.read() == 0
+        reg.invalidate_cache()
+        assert reg.read() == 0x5
+        assert bus.reads == 2
+
+    def test_rw1c_write_invalidates_cache(self):
+        bus = CountingBus()
+        reg = Register("CTRL", 0x10, bus, self._fields("rw1c"), cache_reads=True)
+
+        reg.write_field("STATUS", 1)
+        reg.write_field("ENABLE", 1)
+
+        assert bus.reads == 2
+
+    def test_wo_write_is_not_cached_as_readback(self):
+        bus = CountingBus()
+        reg = Register("CTRL", 0x10, bus, self._fields("wo"), cache_reads=True)
+
+        reg.write(0x131)
+        reg.read()
+
+        assert bus.reads == 1
+
+    def test_cache_disabled_by_default(self):
+        bus = CountingBus()
+        reg = Register("CTRL", 0x10, bus, self._fields())
+
+        reg.write_field("ENABLE", 1)
+        reg.write_field("MODE", 3)
+
+        assert bus.reads == 2
+
+
+class TestSkipRead:
+    def test_full_register_write_skips_read(self):
+        bus = CountingBus()
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="IRQ", offset=1, width=1, access="rw1c"),
+            BitField(name="MODE", offset=4, width=4),
+        ]
+        reg = Register("CTRL", 0x10, bus, fields)
+
+        reg.write_multiple_fields({"ENABLE": 1, "MODE": 2})
+
+        assert bus.reads == 0
+        assert bus.memory[0x10] == 0x21
+
+    def test_single_rw_field_write_skips_read(self):
+        bus = CountingBus()
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="DONE", offset=1, width=1, access="ro"),
+        ]
+        reg = Register("CTRL", 0x10, bus, fields)
+
+        reg.write_field("ENABLE", 1)
+
+        assert bus.reads == 0
+        assert bus.memory[0x10] == 0x1
+
+    def test_partial_write_still_reads(self):
+        bus = CountingBus()
+        bus.memory[0x10] = 0x30
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="MODE", offset=4, width=4),
+        ]
+        reg = Register("CTRL", 0x10, bus, fields)
+
+        reg.write_field("ENABLE", 1)
+
+        assert bus.reads == 1
+        assert bus.memory[0x10] == 0x31
+
+
+class TestAsyncRegisterBus:
+    def _fields(self):
+        return [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="MODE", offset=4, width=4),
+        ]
+
+    def test_coroutine_bus(self):
+        bus = AsyncDictBus()
+        bus.memory[0x10] = 0x30
+        reg = AsyncRegister("CTRL", 0x10, bus, self._fields())
+
+        asyncio.run(reg.write_field("ENABLE", 1))
+
+        assert bus.memory[0x10] == 0x31
+        assert asyncio.run(reg.read_field("MODE")) == 3
+
+    def test_sync_bus(self):
+        bus = CountingBus()
+        bus.memory[0x10] = 0x30
+        reg = AsyncRegister("CTRL", 0x10, bus, self._fields())
+
+        asyncio.run(reg.write_field("ENABLE", 1))
+
+        assert bus.memory[0x10] == 0x31
+        assert asyncio.run(reg.read_field("MODE")) == 3
+
+    def test_bus_methods_wrapped_after_construction(self):
+        bus = AsyncDictBus()
+        bus.memory[0x10] = 0x30
+        reg = AsyncRegister("CTRL", 0x10, bus, self._fields())
+        bus.read_word = lambda address: bus.memory.get(address, 0)
+        bus.write_word = functools.partial(AsyncDictBus.write_word, bus)
+
+        asyncio.run(reg.write_field("ENABLE", 1))
+
+        assert bus.memory[0x10] == 0x31
+        assert asyncio.run(reg.read_field("MODE")) == 3
+
+
+class TestRegisterArrayAccessor:
+    def test_elements_are_reused(self):
+        bus = CountingBus()
+        fields = [BitField(name="VALUE", offset=0, width=8)]
+        array = RegisterArrayAccessor("LUT", 0x100, 4, 4, fields, bus)
+
+        assert array[2] is array[2]
+        assert array[2].offset == 0x108
+        assert array[1] is not array[2]
+        with pytest.raises(IndexError):
+            array[4]
+
+
+class TestBusWidth:
+    def test_write_truncates_to_bus_width(self):
+        bus = CountingBus()
+        fields = [BitField(name="DATA", offset=0, width=16)]
+        reg = Register("DATA", 0x0, bus, fields, bus_width_bits=16)
+
+        reg.write(0x12345)
+
+        assert bus.memory[0x0] == 0x2345
+
+    def test_default_bus_width_is_32(self):
+        bus = CountingBus()
+        fields = [BitField(name="DATA", offset=0, width=32)]
+        reg = Register("DATA", 0x0, bus, fields)
+
+        reg.write(0x1_2345_6789)
+
+        assert bus.memory[0x0] == 0x2345_6789
+
+
+class TestRmwBatch:
+    def test_updates_all_registers(self):
+        bus = AsyncDictBus()
+        bus.memory[0x0] = 0x30
+        bus.memory[0x4] = 0x50
+        fields = [
+            BitField(name="ENABLE", offset=0, width=1),
+            BitField(name="MODE", offset=4, width=4),
+        ]
+        reg0 = AsyncRegister("CTRL0", 0x0, bus, fields)
+        reg1 = AsyncRegister("CTRL1", 0x4, bus, fields)
+
+        asyncio.run(rmw_batch([(reg0, {"ENABLE": 1}), (reg1, {"MODE": 2})]))
+
+        assert bus.memory[0x0] == 0x31
+        assert bus.memory[0x4] == 0x20
+
+    def test_repeated_register_updates_are_merged(self):
+        bus = AsyncDictBus()
+        bus.memory[0x0] = 0x00
+        fields = [
+            BitField(name="EN", offset=0, width=1),
+            BitField(name="MODE", offset=4, width=4),
+        ]
+        ctrl = AsyncRegister("CTRL", 0x0, bus, fields)
+
+        asyncio.run(rmw_batch([(ctrl, {"EN": 1}), (ctrl, {"MODE": 3})]))
+
+        assert bus.memory[0x0] == 0x31
+
+    def test_value_too_wide_raises(self):
+        bus = AsyncDictBus()
+        reg = AsyncRegister("CTRL", 0x0, bus, [BitField(name="EN", offset=0, width=1)])
+
+        with pytest.raises(ValueError):
+            asyncio.run(rmw_batch([(reg, {"EN": 2})]))
+        assert bus.memory == {}
@@ -274,6 +274,26 @@ class TestRW1CAccessType:
         with pytest.raises(ValueError):
             BitField(name="test", offset=0, width=1, access="invalid")
 
+    def test_reset_value_from_fields(self):
+        fields = [
+            BitField(name="a", offset=0, width=4, reset_value=0x5),
+            BitField(name="b", offset=8, width=4, access="ro", reset_value=0xA),
+            BitField(name="c", offset=16, width=4),
+        ]
+        reg = Register(name="r", offset=0, bus=self.bus, fields=fields)
+        assert reg.reset_value == 0x0A05
+
+    def test_access_normalized_to_enum(self):
+        f = BitField(name="test", offset=0, width=1, access="ro")
+        assert f.access is RuntimeAccessType.RO
+        assert f.access == "ro"
+
+    def test_bitfield_is_immutable(self):
+        f = BitField(name="test", offset=4, width=4)
+        with pytest.raises(AttributeError):
+            f.width = 8
+        assert f.mask == 0xF0
+
 
 if __name__ == "__main__":
     t = TestRW1CAccessType()
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import jinja2
+import pytest
+
+from ipcraft.generator.hdl.ipcore_project_generator import IpCoreProjectGenerator
+from ipcraft.model.base import VLNV
+from ipcraft.model.bus_library import get_bus_library
+from ipcraft.model.core import IpCore
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jinja_bytecode_cache(tmp_path_factory):
+    """Cache compiled templates on disk for every generator built in the session.
+
+    The directory sits next to the per-worker base temp dir so pytest-xdist
+    workers share it. Cache entries are keyed by template source checksum,
+    so they never go stale.
+    """
+    cache_dir = tmp_path_factory.getbasetemp().parent / "jinja_bc_shared"
+    cache_dir.mkdir(exist_ok=True)
+    cache = jinja2.FileSystemBytecodeCache(directory=str(cache_dir))
+    original_init = IpCoreProjectGenerator.__init__
+
+    def init_with_cache(self, *args, **kwargs):
+        kwargs.setdefault("bytecode_cache", cache)
+        original_init(self, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(IpCoreProjectGenerator, "__init__", init_with_cache)
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def bus_library():
+    """Process-wide bus library, passed explicitly to every generator."""
+    return get_bus_library()
+
+
+@pytest.fixture(scope="session")
+def generator(tmp_path_factory, bus_library):
+    """Shared VHDL generator; tests only call its read-only generate_* methods.
+
+    Its templates are compiled ahead of time to Python modules and loaded
+    with a ModuleLoader, so no test pays for lexing or parsing them.
+    """
+    gen = IpCoreProjectGenerator(bus_library=bus_library)
+    target = tmp_path_factory.mktemp("compiled_templates")
+    gen.env.compile_templates(str(target), zip=None, ignore_errors=False)
+    gen.env.loader = jinja2.ModuleLoader(str(target))
+    return gen
+
+
+@pytest.fixture(scope="session")
+def templates_dir(generator):
+    """Get templates directory."""
+    return Path(generator.template_dirs[0])
+
+
+@pytest.fixture(scope="session")
+def make_ipcore():
+    """Return a factory for minimal IP cores, cached by name.
+
+    The cores have no ports, parameters or memory maps and are not mutated
+    by the generator, so one instance per name is shared by all tests.
+    """
+    cache = {}
+
+    def _make(name):
+        if name not in cache:
+            cache[name] = IpCore(
+                vlnv=VLNV(vendor="test", library="lib", name=name, version="1.0"),
+                description=f"{name} test",
+                ports=[],
+                parameters=[],
+                memory_maps=[],
+            )
+        return cache[name]
+
+    return _make
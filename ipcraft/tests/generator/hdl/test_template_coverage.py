@@ -1,10 +1,9 @@
 """Template rendering coverage tests for VHDL generator."""
 
-from pathlib import Path
+import os
 
 import pytest
 
-from ipcraft.generator.hdl.ipcore_project_generator import IpCoreProjectGenerator
 from ipcraft.model.base import VLNV, Parameter, ParameterType
 from ipcraft.model.core import IpCore
 from ipcraft.model.memory_map import (
@@ -17,109 +16,155 @@ from ipcraft.model.memory_map import (
 from ipcraft.model.port import Port, PortDirection
 
 
-class TestTemplateRendering:
-    """Test that all templates render without errors."""
-
-    @pytest.fixture
-    def generator(self):
-        """Create VHDL generator instance."""
-        return IpCoreProjectGenerator()
-
-    @pytest.fixture
-    def templates_dir(self):
-        """Get templates directory."""
-        gen = IpCoreProjectGenerator()
-        return Path(gen.env.loader.searchpath[0])
-
-    @pytest.fixture
-    def simple_ip_core(self):
-        """Create a simple IP core for testing."""
-        return IpCore(
-            vlnv=VLNV(
-                vendor="test", library="lib", name="template_test", version="1.0"
-            ),
-            description="Template test IP",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
+def assert_contains(text, *tokens):
+    """Assert every token occurs in text, reporting all missing ones at once."""
+    missing = [token for token in tokens if token not in text]
+    assert not missing, f"missing tokens: {missing}"
+
+
+@pytest.fixture(scope="module")
+def simple_ip_core():
+    """Create a simple IP core for testing."""
+    return IpCore(
+        vlnv=VLNV(vendor="test", library="lib", name="template_test", version="1.0"),
+        description="Template test IP",
+        ports=[],
+        parameters=[],
+        memory_maps=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def ip_core_with_registers():
+    """Create an IP core with registers."""
+    memory_map = MemoryMap(
+        name="regs",
+        address_blocks=[
+            AddressBlock(
+                name="control",
+                base_address=0x0000,
+                range=0x1000,
+                width=32,
+                registers=[
+                    RegisterDef(
+                        name="CTRL",
+                        address_offset=0x00,
+                        size=32,
+                        access=AccessType.READ_WRITE,
+                        fields=[
+                            BitFieldDef(
+                                name="enable",
+                                bit_offset=0,
+                                bit_width=1,
+                                access=AccessType.READ_WRITE,
+                            ),
+                            BitFieldDef(
+                                name="mode",
+                                bit_offset=1,
+                                bit_width=2,
+                                access=AccessType.READ_WRITE,
+                            ),
+                        ],
+                    ),
+                    RegisterDef(
+                        name="STATUS",
+                        address_offset=0x04,
+                        size=32,
+                        access=AccessType.READ_ONLY,
+                        fields=[
+                            BitFieldDef(
+                                name="ready",
+                                bit_offset=0,
+                                bit_width=1,
+                                access=AccessType.READ_ONLY,
+                            )
+                        ],
+                    ),
+                ],
+            )
+        ],
+    )
+
+    return IpCore(
+        vlnv=VLNV(vendor="test", library="lib", name="reg_test", version="1.0"),
+        description="Register test IP",
+        ports=[],
+        parameters=[],
+        memory_maps=[memory_map],
+    )
+
+
+@pytest.fixture(scope="module")
+def ip_core_with_ports():
+    """Create an IP core with ports."""
+    return IpCore(
+        vlnv=VLNV(vendor="test", library="lib", name="port_test", version="1.0"),
+        description="Port test IP",
+        ports=[
+            Port(name="data_in", direction=PortDirection.IN, width=32),
+            Port(name="data_out", direction=PortDirection.OUT, width=32),
+            Port(name="valid", direction=PortDirection.OUT, width=1),
+        ],
+        parameters=[
+            Parameter(name="DATA_WIDTH", data_type=ParameterType.INTEGER, value=32),
+            Parameter(name="FIFO_DEPTH", data_type=ParameterType.INTEGER, value=16),
+        ],
+        memory_maps=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def many_ports_ipcore():
+    """Create an IP core with many user ports."""
+    ports = [
+        Port(
+            name=f"port{i}",
+            direction=PortDirection.IN if i % 2 == 0 else PortDirection.OUT,
+            width=8,
         )
+        for i in range(20)
+    ]
+
+    return IpCore(
+        vlnv=VLNV(vendor="test", library="lib", name="many_ports", version="1.0"),
+        description="Many ports test",
+        ports=ports,
+    )
+
+
+@pytest.fixture(scope="module")
+def render_all(generator):
+    """Render generate_all once per (IP core, bus type, include_regs)."""
+    rendered = {}
+
+    def _render(ip_core, bus_type="axil", include_regs=False):
+        key = (id(ip_core), bus_type, include_regs)
+        if key not in rendered:
+            rendered[key] = generator.generate_all(
+                ip_core, bus_type=bus_type, include_regs=include_regs
+            )
+        return rendered[key]
 
-    @pytest.fixture
-    def ip_core_with_registers(self):
-        """Create an IP core with registers."""
-        memory_map = MemoryMap(
-            name="regs",
-            address_blocks=[
-                AddressBlock(
-                    name="control",
-                    base_address=0x0000,
-                    range=0x1000,
-                    width=32,
-                    registers=[
-                        RegisterDef(
-                            name="CTRL",
-                            address_offset=0x00,
-                            size=32,
-                            access=AccessType.READ_WRITE,
-                            fields=[
-                                BitFieldDef(
-                                    name="enable",
-                                    bit_offset=0,
-                                    bit_width=1,
-                                    access=AccessType.READ_WRITE,
-                                ),
-                                BitFieldDef(
-                                    name="mode",
-                                    bit_offset=1,
-                                    bit_width=2,
-                                    access=AccessType.READ_WRITE,
-                                ),
-                            ],
-                        ),
-                        RegisterDef(
-                            name="STATUS",
-                            address_offset=0x04,
-                            size=32,
-                            access=AccessType.READ_ONLY,
-                            fields=[
-                                BitFieldDef(
-                                    name="ready",
-                                    bit_offset=0,
-                                    bit_width=1,
-                                    access=AccessType.READ_ONLY,
-                                )
-                            ],
-                        ),
-                    ],
-                )
-            ],
-        )
+    return _render
 
-        return IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="reg_test", version="1.0"),
-            description="Register test IP",
-            ports=[],
-            parameters=[],
-            memory_maps=[memory_map],
-        )
 
-    @pytest.fixture
-    def ip_core_with_ports(self):
-        """Create an IP core with ports."""
-        return IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="port_test", version="1.0"),
-            description="Port test IP",
-            ports=[
-                Port(name="data_in", direction=PortDirection.IN, width=32),
-                Port(name="data_out", direction=PortDirection.OUT, width=32),
-                Port(name="valid", direction=PortDirection.OUT, width=1),
-            ],
-            parameters=[
-                Parameter(name="DATA_WIDTH", data_type=ParameterType.INTEGER, value=32),
-                Parameter(name="FIFO_DEPTH", data_type=ParameterType.INTEGER, value=16),
-            ],
-            memory_maps=[],
-        )
+@pytest.fixture(scope="module")
+def rendered_pkg_registers(generator, ip_core_with_registers):
+    """Render the package for the register IP core once."""
+    return generator.generate_package(ip_core_with_registers)
+
+
+@pytest.fixture(scope="module")
+def vendor_files(generator, simple_ip_core):
+    """Render vendor integration files once per vendor option."""
+    return {
+        vendor: generator.generate_vendor_files(simple_ip_core, vendor=vendor)
+        for vendor in ("intel", "xilinx", "both")
+    }
+
+
+class TestTemplateRendering:
+    """Test that all templates render without errors."""
 
     def test_all_templates_exist(self, templates_dir):
         """Verify all expected templates exist."""
@@ -139,9 +184,9 @@ class TestTemplateRendering:
             "memmap.yml.j2",
         ]
 
+        present = {entry.name for entry in os.scandir(templates_dir)}
         for template_name in expected_templates:
-            template_path = templates_dir / template_name
-            assert template_path.exists(), f"Template not found: {template_name}"
+            assert template_name in present, f"Template not found: {template_name}"
 
     def test_package_template(self, generator, simple_ip_core):
         """Test package.vhdl.j2 renders without errors."""
@@ -150,64 +195,47 @@ class TestTemplateRendering:
         assert len(result) > 0
         assert "package" in result
 
-    def test_package_template_with_registers(self, generator, ip_core_with_registers):
+    @pytest.mark.parametrize("token", ["CTRL", "STATUS", "enable", "ready"])
+    def test_package_template_with_registers(self, rendered_pkg_registers, token):
         """Test package template with registers."""
-        result = generator.generate_package(ip_core_with_registers)
-        assert result is not None
-        assert "CTRL" in result
-        assert "STATUS" in result
-        assert "enable" in result
-        assert "ready" in result
+        assert token in rendered_pkg_registers
 
     def test_top_template_axil(self, generator, simple_ip_core):
         """Test top.vhdl.j2 renders with AXI-Lite."""
         result = generator.generate_top(simple_ip_core, bus_type="axil")
         assert result is not None
-        assert "entity" in result
-        assert "template_test" in result
+        assert_contains(result, "entity", "template_test")
 
     def test_top_template_with_ports(self, generator, ip_core_with_ports):
         """Test top template with user ports."""
         result = generator.generate_top(ip_core_with_ports, bus_type="axil")
         assert result is not None
-        assert "data_in" in result
-        assert "data_out" in result
-        assert "valid" in result
+        assert_contains(result, "data_in", "data_out", "valid")
 
     def test_core_template(self, generator, simple_ip_core):
         """Test core.vhdl.j2 renders without errors."""
         result = generator.generate_core(simple_ip_core)
         assert result is not None
-        assert "entity" in result
-        assert "_core" in result
-
-    def test_bus_axil_template(self, generator, simple_ip_core):
-        """Test bus_axil.vhdl.j2 renders without errors."""
-        result = generator.generate_bus_wrapper(simple_ip_core, bus_type="axil")
-        assert result is not None
-        assert "entity" in result
-        assert "_axil" in result
+        assert_contains(result, "entity", "_core")
 
-    def test_bus_avmm_template(self, generator, simple_ip_core):
-        """Test bus_avmm.vhdl.j2 renders without errors."""
-        result = generator.generate_bus_wrapper(simple_ip_core, bus_type="avmm")
+    @pytest.mark.parametrize("bus_type", ["axil", "avmm"])
+    def test_bus_wrapper_template(self, generator, simple_ip_core, bus_type):
+        """Test bus_<type>.vhdl.j2 renders without errors."""
+        result = generator.generate_bus_wrapper(simple_ip_core, bus_type=bus_type)
         assert result is not None
-        assert "entity" in result
-        assert "_avmm" in result
+        assert_contains(result, "entity", f"_{bus_type}")
 
     def test_register_file_template(self, generator, ip_core_with_registers):
         """Test register_file.vhdl.j2 renders without errors."""
         result = generator.generate_register_file(ip_core_with_registers)
         assert result is not None
-        assert "entity" in result
-        assert "_regs" in result
+        assert_contains(result, "entity", "_regs")
 
     def test_intel_hw_tcl_template(self, generator, simple_ip_core):
         """Test intel_hw_tcl.j2 renders without errors."""
         result = generator.generate_intel_hw_tcl(simple_ip_core)
         assert result is not None
-        assert "package require qsys" in result
-        assert "set_module_property" in result
+        assert_contains(result, "package require qsys", "set_module_property")
 
     def test_intel_hw_tcl_with_registers(self, generator, ip_core_with_registers):
         """Test Intel TCL template with registers."""
@@ -219,11 +247,13 @@ class TestTemplateRendering:
         """Test xilinx_component_xml.j2 renders without errors."""
         result = generator.generate_xilinx_component_xml(simple_ip_core)
         assert result is not None
-        assert "<?xml version=" in result
-        assert "spirit:component" in result
+        assert_contains(result, "<?xml version=", "spirit:component")
         # VLNV is rendered as separate XML tags, not colon-separated
-        assert "<spirit:vendor>test</spirit:vendor>" in result
-        assert "<spirit:name>template_test</spirit:name>" in result
+        assert_contains(
+            result,
+            "<spirit:vendor>test</spirit:vendor>",
+            "<spirit:name>template_test</spirit:name>",
+        )
 
     def test_xilinx_xml_with_ports(self, generator, ip_core_with_ports):
         """Test Xilinx XML template with ports."""
@@ -235,40 +265,32 @@ class TestTemplateRendering:
         """Test cocotb_test.py.j2 renders without errors."""
         result = generator.generate_cocotb_test(simple_ip_core)
         assert result is not None
-        assert "import cocotb" in result
-        assert "async def" in result
+        assert_contains(result, "import cocotb", "async def")
 
     def test_cocotb_test_with_registers(self, generator, ip_core_with_registers):
         """Test cocotb test template with registers."""
         result = generator.generate_cocotb_test(ip_core_with_registers)
         assert result is not None
         # Template uses dynamic driver loading, so check for driver functions
-        assert "load_driver" in result
-        assert "reg_test.mm.yml" in result
+        assert_contains(result, "load_driver", "reg_test.mm.yml")
 
     def test_cocotb_makefile_template(self, generator, simple_ip_core):
         """Test cocotb_makefile.j2 renders without errors."""
         result = generator.generate_cocotb_makefile(simple_ip_core)
         assert result is not None
-        assert "SIM ?= ghdl" in result
-        assert "TOPLEVEL" in result
-        assert "VHDL_SOURCES" in result
+        assert_contains(result, "SIM ?= ghdl", "TOPLEVEL", "VHDL_SOURCES")
 
     def test_memmap_yml_template(self, generator, ip_core_with_registers):
         """Test memmap.yml.j2 renders without errors."""
         result = generator.generate_memmap_yaml(ip_core_with_registers)
         assert result is not None
-        assert "CTRL" in result
-        assert "STATUS" in result
+        assert_contains(result, "CTRL", "STATUS")
         # YAML format checks
         assert "address:" in result or "offset:" in result
 
-    def test_all_templates_render_simple(self, generator, simple_ip_core):
+    def test_all_templates_render_simple(self, render_all, simple_ip_core):
         """Test all templates render with simple IP core."""
-        # Generate all files
-        files = generator.generate_all(
-            simple_ip_core, bus_type="axil", include_regs=False
-        )
+        files = render_all(simple_ip_core, bus_type="axil", include_regs=False)
 
         # Should have at least package, top, core, bus wrapper
         assert len(files) >= 4
@@ -279,13 +301,10 @@ class TestTemplateRendering:
             assert len(content) > 0, f"{filename} is empty"
 
     def test_all_templates_render_with_registers(
-        self, generator, ip_core_with_registers
+        self, render_all, ip_core_with_registers
     ):
         """Test all templates render with registers."""
-        # Generate all files
-        files = generator.generate_all(
-            ip_core_with_registers, bus_type="axil", include_regs=True
-        )
+        files = render_all(ip_core_with_registers, bus_type="axil", include_regs=True)
 
         # Should have package, top, core, bus wrapper, regfile
         assert len(files) >= 5
@@ -295,34 +314,28 @@ class TestTemplateRendering:
             assert content is not None, f"{filename} is None"
             assert len(content) > 0, f"{filename} is empty"
 
-    def test_both_bus_types_render(self, generator, simple_ip_core):
+    @pytest.mark.parametrize("bus_type", ["axil", "avmm"])
+    def test_both_bus_types_render(self, render_all, simple_ip_core, bus_type):
         """Test both AXI-Lite and Avalon-MM bus wrappers render."""
-        axil_files = generator.generate_all(simple_ip_core, bus_type="axil")
-        avmm_files = generator.generate_all(simple_ip_core, bus_type="avmm")
+        files = render_all(simple_ip_core, bus_type=bus_type)
 
-        # Both should succeed
-        assert len(axil_files) >= 4
-        assert len(avmm_files) >= 4
-
-        # Should have different bus wrapper files
-        assert any("_axil.vhd" in f for f in axil_files.keys())
-        assert any("_avmm.vhd" in f for f in avmm_files.keys())
+        assert len(files) >= 4
+        assert any(f"_{bus_type}.vhd" in f for f in files.keys())
 
-    def test_vendor_files_all_render(self, generator, simple_ip_core):
+    def test_vendor_files_all_render(self, vendor_files):
         """Test all vendor integration files render."""
         # Intel
-        intel_files = generator.generate_vendor_files(simple_ip_core, vendor="intel")
+        intel_files = vendor_files["intel"]
         assert len(intel_files) == 1
         assert any("_hw.tcl" in f for f in intel_files.keys())
 
         # Xilinx
-        xilinx_files = generator.generate_vendor_files(simple_ip_core, vendor="xilinx")
+        xilinx_files = vendor_files["xilinx"]
         assert len(xilinx_files) >= 1
         assert "component.xml" in xilinx_files
 
         # Both
-        both_files = generator.generate_vendor_files(simple_ip_core, vendor="both")
-        assert len(both_files) >= 2
+        assert len(vendor_files["both"]) >= 2
 
     def test_testbench_files_all_render(self, generator, ip_core_with_registers):
         """Test all testbench files render."""
@@ -332,39 +345,34 @@ class TestTemplateRendering:
         assert len(tb_files) == 2
 
         name = ip_core_with_registers.vlnv.name.lower()
-        assert f"{name}_test.py" in tb_files
-        assert "Makefile" in tb_files
+        assert_contains(tb_files, f"{name}_test.py", "Makefile")
 
         # All should have content
         for content in tb_files.values():
             assert len(content) > 0
 
-    def test_templates_no_syntax_errors(self, generator, ip_core_with_registers):
+    def test_templates_no_syntax_errors(self, render_all, ip_core_with_registers):
         """Test templates don't produce obvious syntax errors in VHDL."""
-        files = generator.generate_all(ip_core_with_registers, bus_type="axil")
+        files = render_all(ip_core_with_registers, bus_type="axil")
 
         for filename, content in files.items():
             if filename.endswith(".vhd"):
+                # No template artifacts
+                assert "{{" not in content, f"{filename} has unrendered Jinja2 syntax"
+                assert "{%" not in content, f"{filename} has unrendered Jinja2 control"
+
                 # Basic VHDL syntax checks
                 # Package files have 'package', entities have 'entity'
+                lc = content.lower()
                 assert (
-                    "entity" in content.lower() or "package" in content.lower()
+                    "entity" in lc or "package" in lc
                 ), f"{filename} missing entity or package"
-                assert "end" in content.lower(), f"{filename} missing end statements"
-
-                # No template artifacts
-                assert "{{" not in content, f"{filename} has unrendered Jinja2 syntax"
-                assert "{%" not in content, f"{filename} has unrendered Jinja2 control"
+                assert "end" in lc, f"{filename} missing end statements"
 
 
 class TestTemplateEdgeCases:
     """Test templates with edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def generator(self):
-        """Create VHDL generator instance."""
-        return IpCoreProjectGenerator()
-
     def test_empty_memory_map(self, generator):
         """Test templates with empty memory maps."""
         ip_core = IpCore(
@@ -379,8 +387,9 @@ class TestTemplateEdgeCases:
         files = generator.generate_all(ip_core, bus_type="axil")
         assert len(files) >= 4
 
-    def test_single_bit_fields(self, generator):
-        """Test with single-bit register fields."""
+    @pytest.fixture(scope="class")
+    def rendered_pkg_flags(self, generator):
+        """Render the package for an IP core with single-bit fields once."""
         memory_map = MemoryMap(
             name="regs",
             address_blocks=[
@@ -416,10 +425,12 @@ class TestTemplateEdgeCases:
             memory_maps=[memory_map],
         )
 
-        result = generator.generate_package(ip_core)
-        assert result is not None
-        assert "flag0" in result
-        assert "flag7" in result
+        return generator.generate_package(ip_core)
+
+    @pytest.mark.parametrize("token", ["flag0", "flag7"])
+    def test_single_bit_fields(self, rendered_pkg_flags, token):
+        """Test with single-bit register fields."""
+        assert token in rendered_pkg_flags
 
     def test_wide_registers(self, generator):
         """Test with wide register fields."""
@@ -461,24 +472,8 @@ class TestTemplateEdgeCases:
         assert result is not None
         assert "DATA" in result
 
-    def test_max_ports(self, generator):
+    def test_max_ports(self, generator, many_ports_ipcore):
         """Test with many ports."""
-        ports = [
-            Port(
-                name=f"port{i}",
-                direction=PortDirection.IN if i % 2 == 0 else PortDirection.OUT,
-                width=8,
-            )
-            for i in range(20)
-        ]
-
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="many_ports", version="1.0"),
-            description="Many ports test",
-            ports=ports,
-        )
-
-        result = generator.generate_top(ip_core, bus_type="axil")
+        result = generator.generate_top(many_ports_ipcore, bus_type="axil")
         assert result is not None
-        assert "port0" in result
-        assert "port19" in result
+        assert_contains(result, "port0", "port19")
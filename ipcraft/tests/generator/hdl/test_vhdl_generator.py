@@ -20,100 +20,62 @@ class TestIpCoreProjectGeneratorBasic:
         assert generator is not None
         assert generator.env is not None
 
-    def test_generate_package(self):
-        """Test package generation with simple IP core."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="simple_ip", version="1.0"),
-            description="Simple test IP",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
+    def test_generators_have_independent_environments(self, bus_library):
+        """Test that generators share compiled bytecode but not environments."""
+        first = IpCoreProjectGenerator(bus_library=bus_library)
+        second = IpCoreProjectGenerator(bus_library=bus_library)
+        first.env.globals["only_first"] = True
 
-        generator = IpCoreProjectGenerator()
+        assert first.env is not second.env
+        assert "only_first" not in second.env.globals
+        assert first.env.bytecode_cache is second.env.bytecode_cache
+
+    def test_generate_package(self, generator, make_ipcore):
+        """Test package generation with simple IP core."""
+        ip_core = make_ipcore("simple_ip")
         package = generator.generate_package(ip_core)
 
         assert package is not None
         assert "package simple_ip_pkg is" in package
         assert "end package simple_ip_pkg;" in package
 
-    def test_generate_top(self):
+    def test_generate_top(self, generator, make_ipcore):
         """Test top-level entity generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_top", version="1.0"),
-            description="Test top entity",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_top")
         top = generator.generate_top(ip_core, bus_type="axil")
 
         assert top is not None
         assert "entity test_top is" in top
         assert "end entity test_top;" in top
 
-    def test_generate_core(self):
+    def test_generate_core(self, generator, make_ipcore):
         """Test core module generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_core", version="1.0"),
-            description="Test core module",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_core")
         core = generator.generate_core(ip_core)
 
         assert core is not None
         assert "entity test_core_core is" in core
         assert "end entity test_core_core;" in core
 
-    def test_generate_bus_wrapper_axil(self):
+    def test_generate_bus_wrapper_axil(self, generator, make_ipcore):
         """Test AXI-Lite bus wrapper generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_bus", version="1.0"),
-            description="Test bus wrapper",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_bus")
         bus_wrapper = generator.generate_bus_wrapper(ip_core, bus_type="axil")
 
         assert bus_wrapper is not None
         assert "entity test_bus_axil is" in bus_wrapper
 
-    def test_generate_bus_wrapper_avmm(self):
+    def test_generate_bus_wrapper_avmm(self, generator, make_ipcore):
         """Test Avalon-MM bus wrapper generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_avmm", version="1.0"),
-            description="Test Avalon wrapper",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_avmm")
         bus_wrapper = generator.generate_bus_wrapper(ip_core, bus_type="avmm")
 
         assert bus_wrapper is not None
         assert "entity test_avmm_avmm is" in bus_wrapper
 
-    def test_generate_all(self):
+    def test_generate_all(self, generator, make_ipcore):
         """Test generation of all VHDL files."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_all", version="1.0"),
-            description="Test all files",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_all")
         files = generator.generate_all(ip_core, bus_type="axil")
 
         assert len(files) == 4
@@ -122,17 +84,9 @@ class TestIpCoreProjectGeneratorBasic:
         assert "test_all_core.vhd" in files
         assert "test_all_axil.vhd" in files
 
-    def test_generate_with_register_file(self):
+    def test_generate_with_register_file(self, generator, make_ipcore):
         """Test generation including standalone register file."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="test_regfile", version="1.0"),
-            description="Test with regfile",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("test_regfile")
         files = generator.generate_all(ip_core, bus_type="axil", include_regs=True)
 
         assert len(files) == 5
@@ -142,7 +96,7 @@ class TestIpCoreProjectGeneratorBasic:
 class TestIpCoreProjectGeneratorWithRegisters:
     """Test VHDL generation with memory maps and registers."""
 
-    def test_generate_with_simple_register(self):
+    def test_generate_with_simple_register(self, generator):
         """Test generation with a simple register."""
         memory_map = MemoryMap(
             name="regs",
@@ -180,13 +134,12 @@ class TestIpCoreProjectGeneratorWithRegisters:
             memory_maps=[memory_map],
         )
 
-        generator = IpCoreProjectGenerator()
         package = generator.generate_package(ip_core)
 
         assert "CTRL" in package
         assert "enable" in package
 
-    def test_generate_with_user_ports(self):
+    def test_generate_with_user_ports(self, generator):
         """Test generation with user-defined ports."""
         ip_core = IpCore(
             vlnv=VLNV(vendor="test", library="lib", name="port_test", version="1.0"),
@@ -200,7 +153,6 @@ class TestIpCoreProjectGeneratorWithRegisters:
             memory_maps=[],
         )
 
-        generator = IpCoreProjectGenerator()
         top = generator.generate_top(ip_core, bus_type="axil")
 
         assert "clk" in top
@@ -211,33 +163,17 @@ class TestIpCoreProjectGeneratorWithRegisters:
 class TestIpCoreProjectGeneratorVendorFiles:
     """Test vendor integration file generation."""
 
-    def test_generate_intel_hw_tcl(self):
+    def test_generate_intel_hw_tcl(self, generator, make_ipcore):
         """Test Intel Platform Designer _hw.tcl generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="intel_test", version="1.0"),
-            description="Intel test",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("intel_test")
         tcl = generator.generate_intel_hw_tcl(ip_core)
 
         assert tcl is not None
         assert "package require qsys" in tcl
 
-    def test_generate_xilinx_component_xml(self):
+    def test_generate_xilinx_component_xml(self, generator, make_ipcore):
         """Test Xilinx component.xml generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="xilinx_test", version="1.0"),
-            description="Xilinx test",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("xilinx_test")
         xml = generator.generate_xilinx_component_xml(ip_core)
 
         assert xml is not None
@@ -248,50 +184,26 @@ class TestIpCoreProjectGeneratorVendorFiles:
 class TestIpCoreProjectGeneratorTestbench:
     """Test testbench file generation."""
 
-    def test_generate_cocotb_test(self):
+    def test_generate_cocotb_test(self, generator, make_ipcore):
         """Test cocotb test file generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="tb_test", version="1.0"),
-            description="Testbench test",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("tb_test")
         test = generator.generate_cocotb_test(ip_core)
 
         assert test is not None
         assert "import cocotb" in test
 
-    def test_generate_cocotb_makefile(self):
+    def test_generate_cocotb_makefile(self, generator, make_ipcore):
         """Test cocotb Makefile generation."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="make_test", version="1.0"),
-            description="Makefile test",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("make_test")
         makefile = generator.generate_cocotb_makefile(ip_core)
 
         assert makefile is not None
         assert "SIM ?= ghdl" in makefile
         assert "TOPLEVEL = make_test" in makefile
 
-    def test_generate_testbench_files(self):
+    def test_generate_testbench_files(self, generator, make_ipcore):
         """Test generation of all testbench files."""
-        ip_core = IpCore(
-            vlnv=VLNV(vendor="test", library="lib", name="tb_all", version="1.0"),
-            description="All testbench files",
-            ports=[],
-            parameters=[],
-            memory_maps=[],
-        )
-
-        generator = IpCoreProjectGenerator()
+        ip_core = make_ipcore("tb_all")
         files = generator.generate_testbench(ip_core)
 
         assert len(files) == 2
@@ -1,36 +1,47 @@
 """End-to-end tests for VHDL generator using example YAML files."""
 
+import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from ipcraft.generator.hdl.ipcore_project_generator import IpCoreProjectGenerator
+from ipcraft.model.base import VLNV
+from ipcraft.model.bus import BusInterface, BusInterfaceMode
+from ipcraft.model.core import IpCore
+from ipcraft.model.memory_map import (
+    AccessType,
+    AddressBlock,
+    BitFieldDef,
+    MemoryMap,
+    RegisterDef,
+)
 from ipcraft.parser.yaml.ip_yaml_parser import YamlIpCoreParser
 
 
-class TestIpCoreProjectGeneratorE2E:
-    """End-to-end generation tests using example YAML specs."""
+@pytest.fixture(scope="session")
+def example_dir():
+    """Get path to example YAML files."""
+    return (
+        Path(__file__).parent.parent.parent.parent.parent / "ipcraft-spec" / "examples"
+    )
 
-    @pytest.fixture
-    def example_dir(self):
-        """Get path to example YAML files."""
-        return (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "ipcraft-spec"
-            / "examples"
-        )
 
-    @pytest.fixture
-    def parser(self):
-        """Create YAML parser instance."""
-        return YamlIpCoreParser()
+@pytest.fixture(scope="session")
+def parser():
+    """Create YAML parser instance."""
+    return YamlIpCoreParser()
 
-    @pytest.fixture
-    def generator(self):
-        """Create VHDL generator instance."""
-        return IpCoreProjectGenerator()
+
+@pytest.fixture(scope="session")
+def generator(bus_library):
+    """Create VHDL generator instance."""
+    return IpCoreProjectGenerator(bus_library=bus_library)
+
+
+class TestIpCoreProjectGeneratorE2E:
+    """End-to-end generation tests using example YAML specs."""
 
     def test_generate_from_minimal_yaml(self, example_dir, parser, generator):
         """Test generation from minimal.ip.yml example."""
@@ -68,10 +79,8 @@ class TestIpCoreProjectGeneratorE2E:
 
         # Verify files generated
         name = ip_core.vlnv.name.lower()
-        assert f"{name}_pkg.vhd" in files
-        assert f"{name}.vhd" in files
-        assert f"{name}_core.vhd" in files
-        assert f"{name}_axil.vhd" in files
+        expected = {f"{name}{suffix}.vhd" for suffix in ("_pkg", "", "_core", "_axil")}
+        assert expected <= files.keys()
 
         # Verify content is not empty
         for filename, content in files.items():
@@ -152,99 +161,60 @@ class TestIpCoreProjectGeneratorE2E:
 
 
 @pytest.mark.slow
+@pytest.mark.skipif(shutil.which("ghdl") is None, reason="GHDL not available")
 class TestIpCoreProjectGeneratorSyntaxValidation:
     """Syntax validation tests using GHDL (requires GHDL installed)."""
 
-    @pytest.fixture
-    def example_dir(self):
-        """Get path to example YAML files."""
-        return (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "ipcraft-spec"
-            / "examples"
-        )
-
-    @pytest.fixture
-    def parser(self):
-        """Create YAML parser instance."""
-        return YamlIpCoreParser()
-
-    @pytest.fixture
-    def generator(self):
-        """Create VHDL generator instance."""
-        return IpCoreProjectGenerator()
-
-    def _check_ghdl_available(self):
-        """Check if GHDL is available."""
-        try:
-            result = subprocess.run(
-                ["ghdl", "--version"], capture_output=True, timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
-
-    def _validate_vhdl_syntax(self, vhdl_files: dict) -> bool:
+    def _validate_vhdl_syntax(self, vhdl_files: dict, tmp_path: Path) -> bool:
         """
         Validate VHDL syntax using GHDL.
 
         Args:
             vhdl_files: Dictionary mapping filename to VHDL content
+            tmp_path: Empty directory to write the files and GHDL library to
 
         Returns:
             True if all files are syntactically correct
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Write all VHDL files
-            vhdl_only = {}
-            for filename, content in vhdl_files.items():
-                if filename.endswith(".vhd"):
-                    (tmppath / filename).write_text(content)
-                    vhdl_only[filename] = content
-
-            # Analyze files in dependency order: package first, then submodules, then top
-            filenames = list(vhdl_only.keys())
-
-            # Sort: package, then register file, then other submodules, then top
-            def sort_key(f):
-                if "_pkg.vhd" in f:
-                    return (0, f)
-                elif any(suffix in f for suffix in ["_regfile.vhd", "_regs.vhd"]):
-                    return (1, f)
-                elif any(
-                    suffix in f for suffix in ["_axil.vhd", "_avmm.vhd", "_core.vhd"]
-                ):
-                    return (2, f)
-                else:
-                    return (3, f)
-
-            filenames.sort(key=sort_key)
-
-            # Analyze each file with GHDL in order
-            for filename in filenames:
-                result = subprocess.run(
-                    ["ghdl", "-a", "--std=08", str(tmppath / filename)],
-                    capture_output=True,
-                    cwd=tmpdir,
-                    timeout=10,
-                )
-                if result.returncode != 0:
-                    print(f"GHDL error in {filename}:")
-                    print(result.stderr.decode())
-                    return False
+        # Write all VHDL files
+        filenames = []
+        for filename, content in vhdl_files.items():
+            if filename.endswith(".vhd"):
+                (tmp_path / filename).write_bytes(content.encode("utf-8"))
+                filenames.append(filename)
+
+        # Sort: package, then register file, then other submodules, then top
+        def sort_key(f):
+            if f.endswith("_pkg.vhd"):
+                return (0, f)
+            elif f.endswith(("_regfile.vhd", "_regs.vhd")):
+                return (1, f)
+            elif f.endswith(("_axil.vhd", "_avmm.vhd", "_core.vhd")):
+                return (2, f)
+            else:
+                return (3, f)
+
+        filenames.sort(key=sort_key)
+
+        # Analyze all files in one GHDL run; order resolves dependencies
+        result = subprocess.run(
+            ["ghdl", "-a", "--std=08", *(str(tmp_path / f) for f in filenames)],
+            capture_output=True,
+            cwd=tmp_path,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            print("GHDL errors:")
+            print(result.stderr.decode())
+            return False
 
-            return True
+        return True
 
-    def test_minimal_yaml_syntax(self, example_dir, parser, generator):
+    @pytest.mark.skip(
+        reason="Minimal IP without registers - generator not designed for this case"
+    )
+    def test_minimal_yaml_syntax(self, example_dir, parser, generator, tmp_path):
         """Test that minimal.ip.yml generates syntactically correct VHDL."""
-        pytest.skip(
-            "Minimal IP without registers - generator not designed for this case"
-        )
-        if not self._check_ghdl_available():
-            pytest.skip("GHDL not available")
-
         yaml_file = example_dir / "test_cases" / "minimal.ip.yml"
         if not yaml_file.exists():
             pytest.xfail(f"Issue #42: Example test data missing: {yaml_file}")
@@ -254,24 +224,12 @@ class TestIpCoreProjectGeneratorSyntaxValidation:
         files = generator.generate_all(ip_core, bus_type="axil")
 
         # Validate syntax
-        assert self._validate_vhdl_syntax(files), "Generated VHDL has syntax errors"
+        assert self._validate_vhdl_syntax(
+            files, tmp_path
+        ), "Generated VHDL has syntax errors"
 
-    def test_ip_with_registers_syntax(self, parser, generator):
+    def test_ip_with_registers_syntax(self, parser, generator, tmp_path):
         """Test GHDL syntax validation with an IP core that has registers."""
-        if not self._check_ghdl_available():
-            pytest.skip("GHDL not available")
-
-        from ipcraft.model.base import VLNV
-        from ipcraft.model.bus import BusInterface, BusInterfaceMode
-        from ipcraft.model.core import IpCore
-        from ipcraft.model.memory_map import (
-            AccessType,
-            AddressBlock,
-            BitFieldDef,
-            MemoryMap,
-            RegisterDef,
-        )
-
         # Create Bus Interface
         bus_iface = BusInterface(
             name="s_axi",
@@ -340,14 +298,15 @@ class TestIpCoreProjectGeneratorSyntaxValidation:
         files = generator.generate_all(ip_core, bus_type="axil", include_regs=True)
 
         # Validate VHDL syntax with GHDL
-        assert self._validate_vhdl_syntax(files), "Generated VHDL has syntax errors"
-
-    def test_basic_yaml_syntax(self, example_dir, parser, generator):
+        assert self._validate_vhdl_syntax(
+            files, tmp_path
+        ), "Generated VHDL has syntax errors"
+
+    @pytest.mark.skip(
+        reason="Basic IP without registers - generator not designed for this case"
+    )
+    def test_basic_yaml_syntax(self, example_dir, parser, generator, tmp_path):
         """Test that basic.ip.yml generates syntactically correct VHDL."""
-        pytest.skip("Basic IP without registers - generator not designed for this case")
-        if not self._check_ghdl_available():
-            pytest.skip("GHDL not available")
-
         yaml_file = example_dir / "test_cases" / "basic.ip.yml"
         if not yaml_file.exists():
             pytest.xfail(f"Issue #42: Example test data missing: {yaml_file}")
@@ -357,4 +316,6 @@ class TestIpCoreProjectGeneratorSyntaxValidation:
         files = generator.generate_all(ip_core, bus_type="axil")
 
         # Validate syntax
-        assert self._validate_vhdl_syntax(files), "Generated VHDL has syntax errors"
+        assert self._validate_vhdl_syntax(
+            files, tmp_path
+        ), "Generated VHDL has syntax errors"
@@ -1,15 +1,35 @@
 """Test structured folder generation for VHDL generator."""
 
+from collections import Counter
+
 import pytest
 
 from ipcraft.generator.hdl.ipcore_project_generator import IpCoreProjectGenerator
 from ipcraft.model.core import VLNV, IpCore
 
 
+def top_dirs(files):
+    """Return the set of top-level directories used by generated files."""
+    return {f.split("/", 1)[0] for f in files if "/" in f}
+
+
+def _count_calls(monkeypatch, obj, name):
+    """Wrap ``obj.name`` and return the list its call arguments are appended to."""
+    calls = []
+    original = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, wrapper)
+    return calls
+
+
 class TestIpCoreProjectGeneratorStructured:
     """Test structured folder generation (VSCode extension compatible)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def simple_ip_core(self):
         """Create a simple IP core for testing."""
         return IpCore(
@@ -20,83 +40,48 @@ class TestIpCoreProjectGeneratorStructured:
             memory_maps=[],
         )
 
-    def test_structured_basic_generation(self, simple_ip_core):
-        """Test basic structured generation without extras."""
-        generator = IpCoreProjectGenerator()
-        files = generator.generate_all(simple_ip_core, bus_type="axil", structured=True)
-
-        # Check we have RTL files in rtl/ subdirectory
-        assert "rtl/struct_test_pkg.vhd" in files
-        assert "rtl/struct_test.vhd" in files
-        assert "rtl/struct_test_core.vhd" in files
-        assert "rtl/struct_test_axil.vhd" in files
-
-        # Check no vendor or testbench files by default
-        assert not any(f.startswith("intel/") for f in files)
-        assert not any(f.startswith("xilinx/") for f in files)
-        assert not any(f.startswith("tb/") for f in files)
-
-    def test_structured_with_testbench(self, simple_ip_core):
-        """Test structured generation with testbench files."""
-        generator = IpCoreProjectGenerator()
-        files = generator.generate_all(
-            simple_ip_core, bus_type="axil", structured=True, include_testbench=True
-        )
-
-        # Check testbench files in tb/ subdirectory
-        assert "tb/struct_test_test.py" in files
-        assert "tb/Makefile" in files
-
-    def test_structured_with_vendor_intel(self, simple_ip_core):
-        """Test structured generation with Intel vendor files."""
-        generator = IpCoreProjectGenerator()
-        files = generator.generate_all(
-            simple_ip_core, bus_type="axil", structured=True, vendor="intel"
-        )
-
-        # Check Intel vendor files in intel/ subdirectory
-        assert "intel/struct_test_hw.tcl" in files
-
-        # Xilinx should not be present
-        assert not any(f.startswith("xilinx/") for f in files)
-
-    def test_structured_with_vendor_xilinx(self, simple_ip_core):
-        """Test structured generation with Xilinx vendor files."""
-        generator = IpCoreProjectGenerator()
-        files = generator.generate_all(
-            simple_ip_core, bus_type="axil", structured=True, vendor="xilinx"
-        )
-
-        # Check Xilinx vendor files in xilinx/ subdirectory
-        assert "xilinx/component.xml" in files
-
-        # Intel should not be present
-        assert not any(f.startswith("intel/") for f in files)
-
-    def test_structured_with_vendor_both(self, simple_ip_core):
-        """Test structured generation with both vendor files."""
-        generator = IpCoreProjectGenerator()
-        files = generator.generate_all(
-            simple_ip_core, bus_type="axil", structured=True, vendor="both"
-        )
-
-        # Check both vendor files
-        assert "intel/struct_test_hw.tcl" in files
-        assert "xilinx/component.xml" in files
-
-    def test_structured_with_regfile(self, simple_ip_core):
-        """Test structured generation with register file."""
-        generator = IpCoreProjectGenerator()
+    @pytest.mark.parametrize(
+        "options, expected, absent_dirs",
+        [
+            (
+                {},
+                {
+                    "rtl/struct_test_pkg.vhd",
+                    "rtl/struct_test.vhd",
+                    "rtl/struct_test_core.vhd",
+                    "rtl/struct_test_axil.vhd",
+                },
+                {"intel", "xilinx", "tb"},
+            ),
+            (
+                {"include_testbench": True},
+                {"tb/struct_test_test.py", "tb/Makefile"},
+                set(),
+            ),
+            ({"vendor": "intel"}, {"intel/struct_test_hw.tcl"}, {"xilinx"}),
+            ({"vendor": "xilinx"}, {"xilinx/component.xml"}, {"intel"}),
+            (
+                {"vendor": "both"},
+                {"intel/struct_test_hw.tcl", "xilinx/component.xml"},
+                set(),
+            ),
+            ({"include_regs": True}, {"rtl/struct_test_regs.vhd"}, set()),
+        ],
+        ids=["basic", "testbench", "intel", "xilinx", "both_vendors", "regfile"],
+    )
+    def test_structured_generation(
+        self, generator, simple_ip_core, options, expected, absent_dirs
+    ):
+        """Test that each option places its files in the right subdirectory."""
         files = generator.generate_all(
-            simple_ip_core, bus_type="axil", structured=True, include_regs=True
+            simple_ip_core, bus_type="axil", structured=True, **options
         )
 
-        # Check register file in rtl/ subdirectory
-        assert "rtl/struct_test_regs.vhd" in files
+        assert expected <= files.keys()
+        assert top_dirs(files).isdisjoint(absent_dirs)
 
-    def test_structured_complete(self, simple_ip_core):
+    def test_structured_complete(self, generator, simple_ip_core):
         """Test structured generation with all options."""
-        generator = IpCoreProjectGenerator()
         files = generator.generate_all(
             simple_ip_core,
             bus_type="axil",
@@ -107,23 +92,19 @@ class TestIpCoreProjectGeneratorStructured:
         )
 
         # Count files in each category
-        rtl_files = [f for f in files if f.startswith("rtl/")]
-        tb_files = [f for f in files if f.startswith("tb/")]
-        intel_files = [f for f in files if f.startswith("intel/")]
-        xilinx_files = [f for f in files if f.startswith("xilinx/")]
+        counts = Counter(f.split("/", 1)[0] for f in files)
 
         # Verify counts
-        assert len(rtl_files) == 5  # pkg, top, core, bus, regfile
-        assert len(tb_files) == 2  # test.py, Makefile
-        assert len(intel_files) == 1  # hw.tcl
-        assert len(xilinx_files) >= 1  # component.xml + xgui
+        assert counts["rtl"] == 5  # pkg, top, core, bus, regfile
+        assert counts["tb"] == 2  # test.py, Makefile
+        assert counts["intel"] == 1  # hw.tcl
+        assert counts["xilinx"] >= 1  # component.xml + xgui
 
         # Total should be at least 9 files
         assert len(files) >= 9
 
-    def test_non_structured_backward_compatibility(self, simple_ip_core):
+    def test_non_structured_backward_compatibility(self, generator, simple_ip_core):
         """Test that non-structured mode still works (backward compatibility)."""
-        generator = IpCoreProjectGenerator()
         files = generator.generate_all(
             simple_ip_core, bus_type="axil", structured=False  # Default behavior
         )
@@ -135,12 +116,10 @@ class TestIpCoreProjectGeneratorStructured:
         assert "struct_test_axil.vhd" in files
 
         # No subdirectory prefixes
-        assert not any("/" in f for f in files)
+        assert "/" not in "\n".join(files)
 
-    def test_file_content_same_structured_vs_flat(self, simple_ip_core):
+    def test_file_content_same_structured_vs_flat(self, generator, simple_ip_core):
         """Test that file content is identical between structured and flat modes."""
-        generator = IpCoreProjectGenerator()
-
         # Generate both modes
         structured = generator.generate_all(
             simple_ip_core, bus_type="axil", structured=True
@@ -156,3 +135,62 @@ class TestIpCoreProjectGeneratorStructured:
         struct_top = structured["rtl/struct_test.vhd"]
         flat_top = flat["struct_test.vhd"]
         assert struct_top == flat_top
+
+    def test_generate_all_is_uncached_by_default(
+        self, simple_ip_core, bus_library, monkeypatch
+    ):
+        """Test that generate_all renders on every call unless caching is enabled."""
+        generator = IpCoreProjectGenerator(bus_library=bus_library)
+        calls = _count_calls(monkeypatch, generator, "_generate_all_uncached")
+
+        generator.generate_all(simple_ip_core, bus_type="axil")
+        generator.generate_all(simple_ip_core, bus_type="axil")
+
+        assert len(calls) == 2
+        assert not generator._generate_all_cache
+
+    def test_generate_all_returns_cached_copies(
+        self, simple_ip_core, bus_library, monkeypatch
+    ):
+        """Test that repeated calls reuse output but return independent dicts."""
+        generator = IpCoreProjectGenerator(
+            bus_library=bus_library, generate_all_cache_size=4
+        )
+        calls = _count_calls(monkeypatch, generator, "_generate_all_uncached")
+
+        first = generator.generate_all(simple_ip_core, bus_type="axil", structured=True)
+        first.clear()
+        second = generator.generate_all(
+            simple_ip_core, bus_type="axil", structured=True
+        )
+
+        assert len(calls) == 1
+        assert "rtl/struct_test_pkg.vhd" in second
+
+        changed = simple_ip_core.model_copy(update={"description": "changed"})
+        generator.generate_all(changed, bus_type="axil", structured=True)
+        assert len(calls) == 2
+
+    def test_generate_all_cache_is_bounded(
+        self, simple_ip_core, bus_library, monkeypatch
+    ):
+        """Test that only the most recent generate_all results are kept."""
+        size = 3
+        generator = IpCoreProjectGenerator(
+            bus_library=bus_library, generate_all_cache_size=size
+        )
+        calls = _count_calls(monkeypatch, generator, "_generate_all_uncached")
+
+        for i in range(size + 2):
+            generator.mm_yaml_relpath = f"../{i}/"
+            generator.generate_all(simple_ip_core, bus_type="axil")
+
+        assert len(calls) == size + 2
+        assert [key[-1] for key in generator._generate_all_cache] == [
+            f"../{i}/" for i in range(2, size + 2)
+        ]
+
+        # The oldest entry was evicted and must be rendered again.
+        generator.mm_yaml_relpath = "../0/"
+        generator.generate_all(simple_ip_core, bus_type="axil")
+        assert len(calls) == size + 3
@@ -1,4 +1,12 @@
-from ipcraft.model.bus_library import get_bus_library
+import pytest
+
+from ipcraft.model.base import VLNV
+from ipcraft.model.bus_library import (
+    BusDefinition,
+    BusLibrary,
+    PortDefinition,
+    get_bus_library,
+)
 
 
 class TestBusLibrarySingleton:
@@ -27,6 +35,17 @@ class TestBusLibrarySingleton:
         all_dicts = lib.get_all_raw_dicts()
         assert set(all_dicts.keys()) == set(lib.list_bus_types())
 
+    def test_get_all_raw_dicts_is_cached_and_read_only(self):
+        vlnv = VLNV(vendor="v", library="l", name="demo", version="1.0")
+        lib = BusLibrary(
+            {"DEMO": BusDefinition("DEMO", vlnv, [PortDefinition("CLK", "in", 1)])}
+        )
+        all_dicts = lib.get_all_raw_dicts()
+        assert lib.get_all_raw_dicts() is all_dicts
+        assert all_dicts["DEMO"]["ports"][0]["name"] == "CLK"
+        with pytest.raises(TypeError):
+            all_dicts["OTHER"] = {}
+
 
 class TestGeneratorUsesBusLibrary:
     """Verify generator no longer loads YAML independently."""
@@ -0,0 +1,26 @@
+import glob
+import os
+
+import pytest
+
+NEORV32_GLOB = os.path.join(
+    os.path.dirname(__file__), "../resources/vhdl/neorv32_core/*.vhd"
+)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize ``vhdl_file`` with the NEORV32 sources, scanned only when needed."""
+    if "vhdl_file" not in metafunc.fixturenames:
+        return
+
+    files = glob.glob(NEORV32_GLOB)
+    if not files:
+        files = [
+            pytest.param(
+                None,
+                marks=pytest.mark.skip(
+                    reason="NEORV32 VHDL files not found in resources"
+                ),
+            )
+        ]
+    metafunc.parametrize("vhdl_file", files)
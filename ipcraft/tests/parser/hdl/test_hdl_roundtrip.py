@@ -3,40 +3,66 @@ Test module for complete HDL roundtrip testing (parse -> generate -> compare).
 This allows testing the full workflow with real HDL files.
 """
 
-import glob
+import io
 import os
 import re
-import tempfile
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict
 
 import pytest
 
-from ipcraft.generator.hdl.ipcore_project_generator import IpCoreProjectGenerator
+from ipcraft.model.port import PortDirection
 from ipcraft.parser.hdl.vhdl_parser import VHDLParser
+from ipcraft.utils import enum_value
 
-# Check if neorv32 files exist
-NEORV32_FILES = glob.glob(
-    os.path.join(os.path.dirname(__file__), "../resources/vhdl/neorv32_core/*.vhd")
-)
+_ENTITY_RE = re.compile(rb"entity\s+(\w+)\s+is", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_DIR_STR = {d: enum_value(d).lower() for d in PortDirection}
+
+# Per-file NEORV32 reports are only written to disk when requested
+_WRITE_REPORTS = os.environ.get("IPCRAFT_TEST_REPORTS") == "1"
+
+
+@lru_cache(maxsize=4096)
+def _port_type_desc(port_type: str, width: int) -> str:
+    """Get a detailed description of the port type for testing and documentation."""
+    if port_type:
+        return port_type
+
+    # Fallback to width-based guess if type string is empty (shouldn't happen with new parser)
+    return "std_logic" if width == 1 else f"std_logic_vector({width - 1} downto 0)"
 
 
 class TestHDLRoundtrip:
     """Test cases for HDL roundtrip: parse -> generate -> compare."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.vhdl_parser = VHDLParser()
-        self.vhdl_generator = IpCoreProjectGenerator()
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def roundtrip_env(cls, tmp_path_factory):
+        """Set up the parser, generator and test files once for the class."""
+        # Imported here so collection does not pull in the generator stack
+        from ipcraft.generator.hdl.ipcore_project_generator import (
+            IpCoreProjectGenerator,
+        )
+
+        cls.vhdl_parser = VHDLParser()
+        cls.vhdl_generator = IpCoreProjectGenerator()
 
         # Create test files for parsing
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_files = self._create_test_files()
+        cls.test_files = cls._create_test_files(tmp_path_factory.mktemp("roundtrip"))
 
-    def teardown_method(self):
-        """Clean up test environment."""
-        self.temp_dir.cleanup()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def output_dir(cls):
+        """Create the report output directory once for all NEORV32 files."""
+        output_dir = os.path.join(os.path.dirname(__file__), "../resources/vhdl/output")
+        if _WRITE_REPORTS:
+            os.makedirs(output_dir, exist_ok=True)
+        return output_dir
 
-    def _create_test_files(self) -> Dict[str, str]:
+    @staticmethod
+    def _create_test_files(temp_dir: Path) -> Dict[str, str]:
         """Create test HDL files for parsing and return paths."""
         test_files = {}
 
@@ -72,7 +98,7 @@ begin
     count <= std_logic_vector(count_internal);
 end architecture behavioral;
         """
-        vhdl_path = os.path.join(self.temp_dir.name, "counter.vhd")
+        vhdl_path = os.path.join(temp_dir, "counter.vhd")
         with open(vhdl_path, "w") as f:
             f.write(vhdl_content)
         test_files["vhdl"] = vhdl_path
@@ -81,7 +107,7 @@ end architecture behavioral;
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace in text for comparison."""
-        return " ".join(text.replace(";", "; ").split())
+        return _WS_RE.sub(" ", text.replace(";", "; ")).strip()
 
     def test_vhdl_roundtrip(self):
         """Test VHDL roundtrip: parse file -> generate VHDL -> compare essentials."""
@@ -95,19 +121,7 @@ end architecture behavioral;
         # Generate VHDL from the IPCore
         generated_vhdl = self.vhdl_generator.generate_core(ip_core)
 
-        # Read original entity part only from the test file
-        with open(self.test_files["vhdl"], "r") as f:
-            original_content = f.read()
-
-        # Extract entity part for comparison (simplified for test)
-        entity_start = original_content.find("entity")
-        entity_end = original_content.find("end entity")
-        original_entity = original_content[
-            entity_start : entity_end + len("end entity counter;")
-        ]
-
         # Compare essential parts of the entity declarations
-        self._normalize_whitespace(original_entity)
         norm_generated = self._normalize_whitespace(generated_vhdl)
 
         # Essential content checks
@@ -119,33 +133,23 @@ end architecture behavioral;
         assert "count : out std_logic_vector(7 downto 0)" in norm_generated
         assert "end entity counter" in norm_generated
 
-    @pytest.mark.skipif(
-        not NEORV32_FILES, reason="NEORV32 VHDL files not found in resources"
-    )
-    @pytest.mark.parametrize(
-        "vhdl_file",
-        NEORV32_FILES,
-    )
-    def test_neorv32_vhdl_files(self, vhdl_file):
+    # vhdl_file is parametrized lazily by pytest_generate_tests in conftest.py
+    def test_neorv32_vhdl_files(self, vhdl_file, output_dir):
         """Test parsing and validating all VHDL files in the neorv32_core directory."""
         # Get just the file name for reporting
         file_basename = os.path.basename(vhdl_file)
 
-        # Create output directory if it doesn't exist
-        output_dir = os.path.join(os.path.dirname(__file__), "../resources/vhdl/output")
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Read the original file content
-        with open(vhdl_file, "r") as f:
-            original_content = f.read().lower()
+        # Read the original file content; only the entity name is decoded
+        original_content = Path(vhdl_file).read_bytes()
 
-        # Check if file contains entity declaration using regex
-        entity_in_file = re.search(
-            r"entity\s+(\w+)\s+is", original_content, re.IGNORECASE | re.DOTALL
-        )
+        # Check if file contains entity declaration using regex; the declaration
+        # normally follows the license header, so try the first 8 KiB first
+        entity_in_file = _ENTITY_RE.search(
+            original_content, 0, 8192
+        ) or _ENTITY_RE.search(original_content)
         expected_entity_name = None
         if entity_in_file:
-            expected_entity_name = entity_in_file.group(1).strip().lower()
+            expected_entity_name = entity_in_file.group(1).decode("ascii").lower()
             print(f"Expected entity name in {file_basename}: {expected_entity_name}")
 
         # Parse the VHDL file
@@ -153,8 +157,11 @@ end architecture behavioral;
             result = self.vhdl_parser.parse_file(vhdl_file)
 
             # Create a detailed report for all files
+            # The report is buffered and written in one go, including partial
+            # reports for files that fail validation
             report_file = os.path.join(output_dir, f"report_{file_basename}.txt")
-            with open(report_file, "w") as f:
+            f = io.StringIO()
+            try:
                 f.write(f"File: {file_basename}\n")
                 f.write(f"Original file: {vhdl_file}\n\n")
 
@@ -183,7 +190,9 @@ end architecture behavioral;
                     if ip_core.ports:
                         f.write(f"Ports ({len(ip_core.ports)}):\n")
                         for port in ip_core.ports:
-                            port_type_str = self._get_port_type_description(port)
+                            port_type_str = _port_type_desc(
+                                getattr(port, "type", "") or "", port.width
+                            )
                             f.write(
                                 f"  - {port.name} : {port.direction} {port_type_str}\n"
                             )
@@ -200,17 +209,20 @@ end architecture behavioral;
                         output_file = os.path.join(
                             output_dir, f"generated_{file_basename}"
                         )
-                        with open(output_file, "w") as vhdl_out:
-                            vhdl_out.write(generated_vhdl)
+                        if _WRITE_REPORTS:
+                            with open(output_file, "w") as vhdl_out:
+                                vhdl_out.write(generated_vhdl)
+
+                        generated_vhdl_lower = generated_vhdl.lower()
 
                         # Basic validation of generated content
                         assert (
                             f"entity {ip_core.vlnv.name.lower()}"
-                            in generated_vhdl.lower()
+                            in generated_vhdl_lower
                         ), f"Missing entity declaration in generated VHDL for {file_basename}"
                         assert (
                             f"end entity {ip_core.vlnv.name.lower()}"
-                            in generated_vhdl.lower()
+                            in generated_vhdl_lower
                         ), f"Missing end entity in generated VHDL for {file_basename}"
 
                         # Type validation - check if all original port types are properly represented
@@ -219,32 +231,21 @@ end architecture behavioral;
                             port_name = port.name.lower()
 
                             # Check direction
-                            from ipcraft.utils import enum_value
-                            direction_str = enum_value(port.direction).lower()
+                            direction_str = _DIR_STR[port.direction]
                             assert (
                                 f"{port_name} : {direction_str}"
-                                in generated_vhdl.lower()
+                                in generated_vhdl_lower
                             ), f"Port {port_name} direction {direction_str} not found in generated VHDL"
 
-                            # Check type - this is a basic check that could be improved
-                            port_type_str = self._get_port_type_description(
-                                port
-                            ).lower()
-                            # Remove whitespace for comparison
-                            "".join(generated_vhdl.lower().split())
-                            f"{port_name}:{direction_str.replace(' ', '')}{port_type_str.replace(' ', '')}"
-
                             # Basic inclusion check instead of strict spaceless match might be safer with type string variations
-                            assert port_name in generated_vhdl.lower()
-                            # assert clean_port in clean_vhdl.replace(
-                            #     " ", ""
-                            # ), f"Port {port_name} with type {port_type_str} not correctly represented in generated VHDL"
+                            assert port_name in generated_vhdl_lower
 
                         f.write("\nValidation: ✅ PASS\n")
                         print(
                             f"✅ Successfully parsed and generated VHDL for entity {ip_core.vlnv.name} from {file_basename}"
                         )
-                        print(f"   Output written to {output_file}")
+                        if _WRITE_REPORTS:
+                            print(f"   Output written to {output_file}")
 
                     except Exception as e:
                         f.write(f"\n❌ Error generating VHDL: {str(e)}\n")
@@ -280,23 +281,17 @@ end architecture behavioral;
                     print(
                         f"⚠️ File {file_basename} parsed but no entity or package found"
                     )
+            finally:
+                if _WRITE_REPORTS:
+                    Path(report_file).write_text(f.getvalue(), encoding="utf-8")
 
         except Exception as e:
             # For errors, write an error report
-            error_report = os.path.join(output_dir, f"error_report_{file_basename}.txt")
-            with open(error_report, "w") as f:
-                f.write(f"Error parsing {file_basename}: {str(e)}\n")
+            if _WRITE_REPORTS:
+                error_report = os.path.join(
+                    output_dir, f"error_report_{file_basename}.txt"
+                )
+                with open(error_report, "w") as f:
+                    f.write(f"Error parsing {file_basename}: {str(e)}\n")
 
             pytest.fail(f"Error parsing {file_basename}: {str(e)}")
-
-    def _get_port_type_description(self, port):
-        """Get a detailed description of the port type for testing and documentation."""
-        if hasattr(port, "type") and port.type:
-            return port.type
-
-        # Fallback to width-based guess if type string is empty (shouldn't happen with new parser)
-        return (
-            "std_logic"
-            if port.width == 1
-            else f"std_logic_vector({port.width - 1} downto 0)"
-        )
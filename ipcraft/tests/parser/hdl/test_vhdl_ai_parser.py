@@ -6,16 +6,18 @@ and validates entity parsing, port extraction, generic handling, and
 bus interface detection.
 """
 
+import hashlib
 from pathlib import Path
 
 import pytest
 
 from ipcraft.model.core import IpCore
 from ipcraft.model.port import PortDirection
+from ipcraft.parser.hdl import vhdl_ai_parser
 from ipcraft.parser.hdl.vhdl_ai_parser import ParserConfig, VHDLAiParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_vhdl_dir():
     """Get the test VHDL directory path."""
     path = Path(__file__).parent.parent.parent / "examples" / "test_vhdl"
@@ -24,7 +26,13 @@ def test_vhdl_dir():
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def test_vhdl_files(test_vhdl_dir):
+    """Map file names in the test VHDL directory to their paths."""
+    return {p.name: p for p in test_vhdl_dir.iterdir()}
+
+
+@pytest.fixture(scope="session")
 def parser_config():
     """Default parser configuration for testing."""
     return ParserConfig(
@@ -32,12 +40,69 @@ def parser_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser(parser_config):
     """Create parser instance."""
     return VHDLAiParser(config=parser_config)
 
 
+@pytest.fixture(scope="session")
+def parse_vhdl(parser, parser_config, pytestconfig):
+    """Parse a VHDL file, reusing LLM results from earlier pytest runs.
+
+    Results are stored in the pytest cache keyed by the parser configuration,
+    the source of the parser module (which holds the prompts) and the file
+    content, so any change to the parser or its prompts forces a new parse.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    parser_key = hashlib.blake2b(digest_size=16)
+    parser_key.update(parser_config.model_dump_json().encode())
+    parser_key.update(Path(vhdl_ai_parser.__file__).read_bytes())
+
+    def parse(vhdl_file: Path) -> IpCore:
+        # Without an LLM the parser only returns placeholder cores
+        if cache is None or not parser.llm_parser.is_available():
+            return parser.parse_file(vhdl_file)
+
+        digest = parser_key.copy()
+        digest.update(vhdl_file.read_bytes())
+        key = f"vhdl_ai/{digest.hexdigest()}"
+
+        cached = cache.get(key, None)
+        if cached is not None:
+            return IpCore.model_validate(cached)
+
+        ip_core = parser.parse_file(vhdl_file)
+        cache.set(key, ip_core.model_dump(mode="json"))
+        return ip_core
+
+    return parse
+
+
+@pytest.fixture(scope="module")
+def simple_counter_ip(parse_vhdl, test_vhdl_dir):
+    """Parse simple_counter.vhd once for all tests in the module."""
+    return parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
+
+
+@pytest.fixture(scope="module")
+def simple_counter_ports(simple_counter_ip):
+    """Ports of simple_counter.vhd keyed by name."""
+    return {p.name: p for p in simple_counter_ip.ports}
+
+
+@pytest.fixture(scope="module")
+def uart_transmitter_ip(parse_vhdl, test_vhdl_dir):
+    """Parse uart_transmitter.vhd once for all tests in the module."""
+    return parse_vhdl(test_vhdl_dir / "uart_transmitter.vhd")
+
+
+@pytest.fixture(scope="module")
+def uart_transmitter_ports(uart_transmitter_ip):
+    """Ports of uart_transmitter.vhd keyed by name."""
+    return {p.name: p for p in uart_transmitter_ip.ports}
+
+
 # ============================================================================
 # Basic Entity Parsing Tests
 # ============================================================================
@@ -46,12 +111,12 @@ def parser(parser_config):
 class TestBasicEntityParsing:
     """Test basic entity structure parsing."""
 
-    def test_simple_counter_parsing(self, parser, test_vhdl_dir):
+    def test_simple_counter_parsing(self, parse_vhdl, test_vhdl_dir):
         """Test parsing of simple counter entity."""
         vhdl_file = test_vhdl_dir / "simple_counter.vhd"
         assert vhdl_file.exists(), f"Test file not found: {vhdl_file}"
 
-        ip_core = parser.parse_file(vhdl_file)
+        ip_core = parse_vhdl(vhdl_file)
 
         assert ip_core is not None
         assert isinstance(ip_core, IpCore)
@@ -59,26 +124,28 @@ class TestBasicEntityParsing:
         assert len(ip_core.ports) == 4
         assert len(ip_core.parameters) == 1
 
-    def test_entity_name_extraction(self, parser, test_vhdl_dir):
-        """Verify entity name is correctly extracted."""
-        test_files = [
+    @pytest.mark.parametrize(
+        "filename, expected_name",
+        [
             ("simple_counter.vhd", "simple_counter"),
             ("uart_transmitter.vhd", "uart_transmitter"),
             ("fifo_buffer.vhd", "fifo_buffer"),
-        ]
+        ],
+    )
+    def test_entity_name_extraction(
+        self, parse_vhdl, test_vhdl_files, filename, expected_name
+    ):
+        """Verify entity name is correctly extracted."""
+        if filename not in test_vhdl_files:
+            pytest.skip(f"{filename} not found")
 
-        for filename, expected_name in test_files:
-            vhdl_file = test_vhdl_dir / filename
-            if vhdl_file.exists():
-                ip_core = parser.parse_file(vhdl_file)
-                assert (
-                    ip_core.vlnv.name == expected_name
-                ), f"Entity name mismatch for {filename}"
+        ip_core = parse_vhdl(test_vhdl_files[filename])
+        assert ip_core.vlnv.name == expected_name
 
-    def test_description_generation(self, parser, test_vhdl_dir):
+    def test_description_generation(self, parse_vhdl, test_vhdl_dir):
         """Verify LLM generates meaningful descriptions."""
         vhdl_file = test_vhdl_dir / "simple_counter.vhd"
-        ip_core = parser.parse_file(vhdl_file)
+        ip_core = parse_vhdl(vhdl_file)
 
         assert ip_core.description is not None
         assert len(ip_core.description) > 0
@@ -93,33 +160,23 @@ class TestBasicEntityParsing:
 class TestPortParsing:
     """Test port extraction and direction parsing."""
 
-    def test_simple_counter_ports(self, parser, test_vhdl_dir):
+    def test_simple_counter_ports(self, simple_counter_ports):
         """Test simple counter port parsing."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
-
-        # Expected ports: clk, rst_n, enable, count
-        port_names = [p.name for p in ip_core.ports]
-        assert "clk" in port_names
-        assert "rst_n" in port_names
-        assert "enable" in port_names
-        assert "count" in port_names
+        expected = {"clk", "rst_n", "enable", "count"}
+        assert expected <= simple_counter_ports.keys()
 
-    def test_port_directions(self, parser, test_vhdl_dir):
+    def test_port_directions(self, simple_counter_ports):
         """Test port direction detection."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
-
-        port_dict = {p.name: p for p in ip_core.ports}
+        port_dict = simple_counter_ports
 
         assert port_dict["clk"].direction == PortDirection.IN
         assert port_dict["rst_n"].direction == PortDirection.IN
         assert port_dict["enable"].direction == PortDirection.IN
         assert port_dict["count"].direction == PortDirection.OUT
 
-    def test_port_widths(self, parser, test_vhdl_dir):
+    def test_port_widths(self, simple_counter_ports):
         """Test port width calculation."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
-
-        port_dict = {p.name: p for p in ip_core.ports}
+        port_dict = simple_counter_ports
 
         # std_logic ports should be width 1
         assert port_dict["clk"].width == 1
@@ -130,25 +187,13 @@ class TestPortParsing:
         # Default WIDTH = 8
         assert port_dict["count"].width == 8
 
-    def test_uart_transmitter_ports(self, parser, test_vhdl_dir):
+    def test_uart_transmitter_ports(self, uart_transmitter_ip, uart_transmitter_ports):
         """Test UART transmitter with multiple port types."""
-        ip_core = parser.parse_file(test_vhdl_dir / "uart_transmitter.vhd")
-
-        assert len(ip_core.ports) == 6
-
-        port_dict = {p.name: p for p in ip_core.ports}
-
-        # System signals
-        assert "clk" in port_dict
-        assert "rst" in port_dict
+        assert len(uart_transmitter_ip.ports) == 6
 
-        # Data interface
-        assert "tx_data" in port_dict
-        assert "tx_valid" in port_dict
-        assert "tx_ready" in port_dict
-
-        # UART output
-        assert "uart_tx" in port_dict
+        # System signals, data interface and serial output
+        expected = {"clk", "rst", "tx_data", "tx_valid", "tx_ready", "uart_tx"}
+        assert expected <= uart_transmitter_ports.keys()
 
 
 # ============================================================================
@@ -159,9 +204,9 @@ class TestPortParsing:
 class TestGenericParsing:
     """Test generic/parameter extraction."""
 
-    def test_simple_counter_generic(self, parser, test_vhdl_dir):
+    def test_simple_counter_generic(self, parse_vhdl, test_vhdl_dir):
         """Test simple generic extraction."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
 
         assert len(ip_core.parameters) == 1
         param = ip_core.parameters[0]
@@ -169,9 +214,9 @@ class TestGenericParsing:
         assert param.data_type == "integer"
         assert param.value == "8"
 
-    def test_uart_transmitter_generics(self, parser, test_vhdl_dir):
+    def test_uart_transmitter_generics(self, parse_vhdl, test_vhdl_dir):
         """Test multiple generics with different types."""
-        ip_core = parser.parse_file(test_vhdl_dir / "uart_transmitter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "uart_transmitter.vhd")
 
         assert len(ip_core.parameters) == 5
 
@@ -194,9 +239,9 @@ class TestGenericParsing:
         assert "PARITY_ENABLE" in param_dict
         assert param_dict["PARITY_ENABLE"].data_type == "boolean"
 
-    def test_fifo_buffer_generics(self, parser, test_vhdl_dir):
+    def test_fifo_buffer_generics(self, parse_vhdl, test_vhdl_dir):
         """Test generics with power-of-2 expressions."""
-        ip_core = parser.parse_file(test_vhdl_dir / "fifo_buffer.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "fifo_buffer.vhd")
 
         assert len(ip_core.parameters) == 2
 
@@ -217,18 +262,16 @@ class TestGenericParsing:
 class TestComplexExpressions:
     """Test parsing of complex arithmetic expressions in port widths."""
 
-    def test_simple_subtraction(self, parser, test_vhdl_dir):
+    def test_simple_subtraction(self, simple_counter_ports):
         """Test WIDTH-1 expression."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
-
-        port_dict = {p.name: p for p in ip_core.ports}
+        port_dict = simple_counter_ports
         # count: std_logic_vector(WIDTH-1 downto 0)
         # With WIDTH=8, should be 8 bits
         assert port_dict["count"].width == 8
 
-    def test_power_of_two(self, parser, test_vhdl_dir):
+    def test_power_of_two(self, parse_vhdl, test_vhdl_dir):
         """Test 2**N expression."""
-        ip_core = parser.parse_file(test_vhdl_dir / "fifo_buffer.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "fifo_buffer.vhd")
 
         # DEPTH_LOG2 = 4, so DEPTH = 2**4 = 16
         # data_count: std_logic_vector(DEPTH_LOG2 downto 0) = 5 bits
@@ -236,21 +279,21 @@ class TestComplexExpressions:
         assert "data_count" in port_dict
         assert port_dict["data_count"].width == 5
 
-    def test_division_expression(self, parser, test_vhdl_dir):
+    def test_division_expression(self, parse_vhdl, test_vhdl_dir):
         """Test (WIDTH/8)-1 expression."""
-        ip_core = parser.parse_file(test_vhdl_dir / "fifo_buffer.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "fifo_buffer.vhd")
 
         # With DATA_WIDTH=32, wr_data should be 32 bits
         port_dict = {p.name: p for p in ip_core.ports}
         assert port_dict["wr_data"].width == 32
 
-    def test_axi_division_expression(self, parser, test_vhdl_dir):
+    def test_axi_division_expression(self, parse_vhdl, test_vhdl_dir):
         """Test complex AXI division: (C_DATA_WIDTH/8)-1."""
         vhdl_file = test_vhdl_dir / "axi_example_peripheral.vhd"
         if not vhdl_file.exists():
             pytest.skip("AXI example file not found")
 
-        ip_core = parser.parse_file(vhdl_file)
+        ip_core = parse_vhdl(vhdl_file)
 
         port_dict = {p.name: p for p in ip_core.ports}
 
@@ -268,13 +311,13 @@ class TestComplexExpressions:
 class TestBusInterfaceDetection:
     """Test AI-powered bus interface detection."""
 
-    def test_axi4_lite_detection(self, parser, test_vhdl_dir):
+    def test_axi4_lite_detection(self, parse_vhdl, test_vhdl_dir):
         """Test AXI4-Lite bus interface detection."""
         vhdl_file = test_vhdl_dir / "axi_example_peripheral.vhd"
         if not vhdl_file.exists():
             pytest.skip("AXI example file not found")
 
-        ip_core = parser.parse_file(vhdl_file)
+        ip_core = parse_vhdl(vhdl_file)
 
         assert len(ip_core.bus_interfaces) >= 1
 
@@ -286,9 +329,9 @@ class TestBusInterfaceDetection:
         assert "s_axi" in axi_bus.name.lower()
         assert axi_bus.mode == "slave"
 
-    def test_axi_stream_detection(self, parser, test_vhdl_dir):
+    def test_axi_stream_detection(self, parse_vhdl, test_vhdl_dir):
         """Test AXI-Stream interface detection."""
-        ip_core = parser.parse_file(test_vhdl_dir / "axi_stream_filter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "axi_stream_filter.vhd")
 
         assert len(ip_core.bus_interfaces) >= 1
 
@@ -302,27 +345,27 @@ class TestBusInterfaceDetection:
             for name, t in zip(bus_names, bus_types)
         )
 
-    def test_spi_detection(self, parser, test_vhdl_dir):
+    def test_spi_detection(self, parse_vhdl, test_vhdl_dir):
         """Test SPI bus interface detection."""
-        ip_core = parser.parse_file(test_vhdl_dir / "spi_master.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "spi_master.vhd")
 
         # Should detect SPI interface from spi_sclk, spi_mosi, spi_miso, spi_cs_n
         bus_types = [b.type for b in ip_core.bus_interfaces]
 
         assert any("spi" in t.lower() for t in bus_types)
 
-    def test_wishbone_detection(self, parser, test_vhdl_dir):
+    def test_wishbone_detection(self, parse_vhdl, test_vhdl_dir):
         """Test Wishbone bus interface detection."""
-        ip_core = parser.parse_file(test_vhdl_dir / "wishbone_slave.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "wishbone_slave.vhd")
 
         # Should detect Wishbone from wb_* signals
         bus_types = [b.type for b in ip_core.bus_interfaces]
 
         assert any("wishbone" in t.lower() or "wb" in t.lower() for t in bus_types)
 
-    def test_no_bus_interface(self, parser, test_vhdl_dir):
+    def test_no_bus_interface(self, parse_vhdl, test_vhdl_dir):
         """Test that simple cores without buses don't detect false positives."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
 
         # Simple counter should have no bus interfaces
         assert len(ip_core.bus_interfaces) == 0
@@ -366,9 +409,9 @@ class TestErrorHandling:
 class TestModelValidation:
     """Test Pydantic model validation."""
 
-    def test_valid_ip_core_model(self, parser, test_vhdl_dir):
+    def test_valid_ip_core_model(self, parse_vhdl, test_vhdl_dir):
         """Test that parsed IP core passes Pydantic validation."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
 
         # Should be valid Pydantic model
         assert isinstance(ip_core, IpCore)
@@ -378,9 +421,9 @@ class TestModelValidation:
         assert json_str is not None
         assert len(json_str) > 0
 
-    def test_vlnv_structure(self, parser, test_vhdl_dir):
+    def test_vlnv_structure(self, parse_vhdl, test_vhdl_dir):
         """Test VLNV structure is correctly populated."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
 
         vlnv = ip_core.vlnv
         assert vlnv.vendor == "unknown.vendor"
@@ -388,9 +431,9 @@ class TestModelValidation:
         assert vlnv.name == "simple_counter"
         assert vlnv.version == "1.0.0"
 
-    def test_port_model_validation(self, parser, test_vhdl_dir):
+    def test_port_model_validation(self, parse_vhdl, test_vhdl_dir):
         """Test Port models are correctly validated."""
-        ip_core = parser.parse_file(test_vhdl_dir / "simple_counter.vhd")
+        ip_core = parse_vhdl(test_vhdl_dir / "simple_counter.vhd")
 
         for port in ip_core.ports:
             # Required fields
@@ -5,6 +5,7 @@ Tests for the YAML IP Core parser.
 # editorconfig-checker-disable-file
 # This file contains YAML fixtures that use 2-space indentation per YAML standard
 
+import os
 from pathlib import Path
 
 import pytest
@@ -15,6 +16,38 @@ from ipcraft.parser import ParseError, YamlIpCoreParser
 # Get the path to the examples directory
 EXAMPLES_DIR = Path(__file__).parent.parent.parent.parent / "examples" / "ip"
 
+# Memory map with a single register, imported by the cache and memo tests
+SIMPLE_MEMMAP = """
+- name: "CSR_MAP"
+  addressBlocks:
+    - name: "REGS"
+      registers:
+        - name: "ID"
+"""
+
+
+def write_ip_core(tmp_path, name, body=""):
+    """Write ``core.yml`` with a VLNV named ``name`` followed by ``body``."""
+    yaml_file = tmp_path / "core.yml"
+    yaml_file.write_text(f"""
+vlnv:
+    vendor: "test.com"
+    library: "test"
+    name: "{name}"
+    version: "1.0.0"
+{body}""")
+    return yaml_file
+
+
+def write_ip_core_with_memmap(tmp_path, name, memmap_content=SIMPLE_MEMMAP):
+    """Write ``regs.mm.yml`` and a ``core.yml`` importing it; return both."""
+    memmap_file = tmp_path / "regs.mm.yml"
+    memmap_file.write_text(memmap_content)
+    yaml_file = write_ip_core(
+        tmp_path, name, f'\nmemoryMaps:\n    import: "{memmap_file.name}"\n'
+    )
+    return yaml_file, memmap_file
+
 
 def test_parse_simple_ip_core(tmp_path):
     """Test parsing a minimal IP core definition."""
@@ -535,3 +568,200 @@ memoryMaps:
     assert fields[1].bit_width == 3
     assert fields[2].bit_offset == 4  # 1 + 3
     assert fields[2].bit_width == 8
+
+
+def test_generate_array_from_register_template(tmp_path):
+    """Test expansion of generateArray entries using register templates."""
+    memmap_content = """
+registerTemplates:
+  channel:
+    - name: "CTRL"
+      access: "read-write"
+      fields:
+        - name: "EN"
+          bits: "[0]"
+        - name: "MODE"
+          bits: "[3:1]"
+    - name: "_STATUS"
+      access: "read-only"
+---
+- name: "CSR"
+  addressBlocks:
+    - name: "REGS"
+      baseAddress: 0x0
+      registers:
+        - name: "ID"
+        - generateArray:
+            name: "CH"
+            count: 3
+            template: "channel"
+        - name: "VERSION"
+"""
+    yaml_file, _ = write_ip_core_with_memmap(tmp_path, "array_core", memmap_content)
+
+    parser = YamlIpCoreParser()
+    ip_core = parser.parse_file(yaml_file)
+
+    regs = ip_core.memory_maps[0].address_blocks[0].registers
+    assert [r.name for r in regs] == [
+        "ID",
+        "CH1_CTRL",
+        "CH1_STATUS",
+        "CH2_CTRL",
+        "CH2_STATUS",
+        "CH3_CTRL",
+        "CH3_STATUS",
+        "VERSION",
+    ]
+    assert [r.address_offset for r in regs] == [0, 4, 8, 12, 16, 20, 24, 28]
+    assert regs[2].access == AccessType.READ_ONLY
+    assert regs[6].access == AccessType.READ_ONLY
+
+    for ctrl in regs[1:7:2]:
+        assert [(f.name, f.bit_offset, f.bit_width) for f in ctrl.fields] == [
+            ("EN", 0, 1),
+            ("MODE", 1, 3),
+        ]
+    assert regs[1].fields[0] is not regs[3].fields[0]
+
+    # Instances must not share mutable bit fields
+    regs[1].fields[0].reset_value = 1
+    assert regs[3].fields[0].reset_value is None
+    assert regs[5].fields[0].reset_value is None
+
+
+def test_address_block_range_from_register_extent(tmp_path):
+    """Test that a block without range is sized from its highest register."""
+    yaml_file = write_ip_core(
+        tmp_path,
+        "range_test",
+        """
+memoryMaps:
+    - name: "REGS"
+      addressBlocks:
+        - name: "SMALL"
+          baseAddress: 0x0
+          registers:
+            - name: "REG0"
+        - name: "LARGE"
+          baseAddress: 0x1000
+          registers:
+            - name: "HIGH"
+              addressOffset: 0x80
+            - name: "LOW"
+              addressOffset: 0x10
+""",
+    )
+
+    parser = YamlIpCoreParser()
+    ip_core = parser.parse_file(yaml_file)
+
+    small, large = ip_core.memory_maps[0].address_blocks
+    assert small.range == 64  # minimum block size
+    assert large.range == 0x84  # out-of-order offsets use the highest end
+
+
+def test_error_reports_failing_item_index(tmp_path):
+    """Test that parse errors name the index of the offending list item."""
+    yaml_file = write_ip_core(
+        tmp_path,
+        "bad_field",
+        """
+memoryMaps:
+    - name: "REGS"
+      addressBlocks:
+        - name: "BLOCK"
+          registers:
+            - name: "REG"
+              fields:
+                - name: "OK"
+                  bits: "[0]"
+                - name: "BAD"
+                  bits: "[3:7]"
+""",
+    )
+
+    parser = YamlIpCoreParser()
+    with pytest.raises(ParseError, match=r"bitField\[1\]"):
+        parser.parse_file(yaml_file)
+
+
+def test_memory_map_cache_reuses_parsed_file(tmp_path):
+    """Test that a cache directory stores and reuses parsed memory maps."""
+    yaml_file, memmap_file = write_ip_core_with_memmap(tmp_path, "cached_core")
+    cache_dir = tmp_path / "cache"
+
+    first = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    cache_files = list(cache_dir.glob("*.pkl"))
+    assert len(cache_files) == 1
+
+    second = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    assert second.memory_maps == first.memory_maps
+
+    memmap_file.write_text(memmap_file.read_text().replace("ID", "VERSION"))
+    third = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    assert third.memory_maps[0].address_blocks[0].registers[0].name == "VERSION"
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_memory_map_cache_recovers_from_corrupt_entry(tmp_path):
+    """Test that a truncated cache entry is discarded and rewritten."""
+    yaml_file, _ = write_ip_core_with_memmap(tmp_path, "cached_core")
+    cache_dir = tmp_path / "cache"
+
+    first = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    (cache_file,) = cache_dir.glob("*.pkl")
+    cache_file.write_bytes(cache_file.read_bytes()[:10])
+
+    second = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    assert second.memory_maps == first.memory_maps
+    assert list(cache_dir.iterdir()) == [cache_file]
+
+    third = YamlIpCoreParser(cache_dir=cache_dir).parse_file(yaml_file)
+    assert third.memory_maps == first.memory_maps
+
+
+def test_parse_file_reuses_result_until_modified(tmp_path):
+    """Test that repeated parses return equal, independent copies."""
+    yaml_file = write_ip_core(tmp_path, "memo_core", 'description: "first"\n')
+    parser = YamlIpCoreParser()
+
+    first = parser.parse_file(yaml_file)
+    second = parser.parse_file(yaml_file)
+    assert first == second
+    assert first is not second
+
+    first.description = "mutated"
+    assert parser.parse_file(yaml_file).description == "first"
+
+    stat = yaml_file.stat()
+    yaml_file.write_text(yaml_file.read_text().replace("first", "second"))
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert parser.parse_file(yaml_file).description == "second"
+
+
+def test_parse_file_detects_edit_with_unchanged_mtime(tmp_path):
+    """Test that the parse cache compares content, not only mtimes."""
+    yaml_file = write_ip_core(tmp_path, "memo_core", 'description: "first"\n')
+    parser = YamlIpCoreParser()
+    assert parser.parse_file(yaml_file).description == "first"
+
+    stat = yaml_file.stat()
+    yaml_file.write_text(yaml_file.read_text().replace("first", "other"))
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert parser.parse_file(yaml_file).description == "other"
+
+
+def test_parse_file_reparses_when_import_modified(tmp_path):
+    """Test that editing an imported memory map invalidates the cached parse."""
+    yaml_file, memmap_file = write_ip_core_with_memmap(tmp_path, "memo_import_core")
+    parser = YamlIpCoreParser()
+
+    first = parser.parse_file(yaml_file)
+    assert first.memory_maps[0].address_blocks[0].registers[0].name == "ID"
+
+    stat = memmap_file.stat()
+    memmap_file.write_text(memmap_file.read_text().replace("ID", "VERSION"))
+    os.utime(memmap_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = parser.parse_file(yaml_file)
+    assert second.memory_maps[0].address_blocks[0].registers[0].name == "VERSION"
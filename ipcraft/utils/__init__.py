@@ -3,6 +3,7 @@
 import re
 import sys
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Any
 from enum import Enum
@@ -34,9 +35,16 @@ if BUS_DEFINITIONS_PATH is None:
         BUS_DEFINITIONS_PATH = repo_root / "ipcraft-spec" / "bus_definitions"
 
 
+# "msb:lsb" or a single bit index, brackets already stripped
+_BIT_RANGE_RE = re.compile(r"(\d+)(?:\s*:\s*(\d+))?")
+
+
+@lru_cache(maxsize=256)
 def parse_bit_range(bits_str: str) -> Tuple[int, int]:
     """Parse bit notation like ``[7:4]`` or ``[0]`` into ``(offset, width)``.
 
+    Results are cached since register maps reuse a small set of notations.
+
     Args:
         bits_str: Bit notation string.
 
@@ -51,20 +59,18 @@ def parse_bit_range(bits_str: str) -> Tuple[int, int]:
 
     clean = bits_str.strip().strip("[]").strip()
 
-    match_range = re.fullmatch(r"(\d+)\s*:\s*(\d+)", clean)
-    if match_range:
-        msb = int(match_range.group(1))
-        lsb = int(match_range.group(2))
-        if msb < lsb:
-            raise ValueError(f"Invalid bit range '{bits_str}': MSB must be >= LSB")
-        return lsb, msb - lsb + 1
+    match = _BIT_RANGE_RE.fullmatch(clean)
+    if not match:
+        raise ValueError(f"Invalid bit range notation: '{bits_str}'")
 
-    match_single = re.fullmatch(r"(\d+)", clean)
-    if match_single:
-        bit = int(match_single.group(1))
-        return bit, 1
+    msb = int(match.group(1))
+    if match.group(2) is None:
+        return msb, 1
 
-    raise ValueError(f"Invalid bit range notation: '{bits_str}'")
+    lsb = int(match.group(2))
+    if msb < lsb:
+        raise ValueError(f"Invalid bit range '{bits_str}': MSB must be >= LSB")
+    return lsb, msb - lsb + 1
 
 
 # Step 1: Canonical bus type keys (alias → canonical key)